@@ -181,10 +181,7 @@ class ProjectManager:
         Returns:
             Le projet correspondant ou None si non trouvé
         """
-        for project in self._projects.values():
-            if project.uuid == uuid:
-                return project
-        return None
+        return self._projects.get(uuid)
     
     def get_project_by_id(self, project_id: str) -> Optional[Project]:
         """
@@ -269,7 +266,7 @@ class ProjectManager:
         
         # Formate si demandé
         if pretty:
-            self._indent_xml(root)
+            ET.indent(root, space="  ")
         
         # Génère le XML complet avec déclaration
         xml_str = ET.tostring(root, encoding='unicode', method='xml')
@@ -433,22 +430,6 @@ class ProjectManager:
     def _find_project_by_id(self, project_id: str) -> Optional[Project]:
         """Trouve un projet par son identifiant nettoyé."""
         return self._projects_by_id.get(project_id)
-    
-    def _indent_xml(self, elem: ET.Element, level: int = 0) -> None:
-        """Ajoute l'indentation au XML pour le rendre lisible."""
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
 
 
 class ProjectManagerError(Exception):
@@ -2,7 +2,7 @@ import xml.etree.ElementTree as ET
 import re
 from pathlib import Path
 from datetime import datetime
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, Slot
 
 from ..utils.xml_utils import (validate_xml_file, extract_xml_statistics, 
                        prettify_xml, clean_xml_content)
@@ -23,6 +23,12 @@ class XMLProcessor(QObject):
         self.data_dir = self.resources_dir / "data"
         self.temp_dir = self.resources_dir / "temp"
 
+    @Slot(str)
+    def process_file(self, xml_file_path):
+        """Traite un nouveau fichier XML avec ce même worker"""
+        self.xml_file_path = xml_file_path
+        self.process()
+
     def process(self):
         """Traite le fichier XML et effectue la fusion"""
         try:
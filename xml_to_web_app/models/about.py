@@ -12,7 +12,7 @@ import uuid
 # Import des utilitaires XML centralisés
 from ..utils.xml_utils import (
     xml_to_string, 
-    validate_html_content, 
+    check_html_content, 
     get_text_preview,
     parse_datetime_safe,
     ValidationError
@@ -89,7 +89,7 @@ class About:
             Chaîne XML représentant les mentions légales
         """
         element = self.to_xml_element()
-        return xml_to_string(element, pretty=pretty)
+        return xml_to_string(element, pretty=pretty, in_place=True)
     
     @classmethod
     def from_xml_element(cls, element: ET.Element) -> 'About':
@@ -213,8 +213,7 @@ def validate_about_content(content_html: str) -> bool:
     Raises:
         AboutValidationError: Si le contenu est invalide
     """
-    try:
-        validate_html_content(content_html, max_length=200000)  # 100KB max pour les présentations
-        return True
-    except ValidationError as e:
-        raise AboutValidationError(str(e))
+    error = check_html_content(content_html, max_length=200000)  # 200KB max pour l'à propos
+    if error is not None:
+        raise AboutValidationError(error)
+    return True
@@ -13,7 +13,7 @@ import html
 # Import des utilitaires XML centralisés
 from ..utils.xml_utils import (
     xml_to_string, 
-    validate_html_content, 
+    check_html_content, 
     get_text_preview,
     parse_datetime_safe,
     ValidationError
@@ -90,7 +90,7 @@ class LegalMentions:
             Chaîne XML représentant les mentions légales
         """
         element = self.to_xml_element()
-        return xml_to_string(element, pretty=pretty)
+        return xml_to_string(element, pretty=pretty, in_place=True)
     
     @classmethod
     def from_xml_element(cls, element: ET.Element) -> 'LegalMentions':
@@ -236,8 +236,7 @@ def validate_legal_mentions_content(content_html: str) -> bool:
     Raises:
         LegalMentionsValidationError: Si le contenu est invalide
     """
-    try:
-        validate_html_content(content_html, max_length=200000)  # 100KB max pour les présentations
-        return True
-    except ValidationError as e:
-        raise LegalMentionsValidationError(str(e))
+    error = check_html_content(content_html, max_length=200000)  # 200KB max pour les mentions légales
+    if error is not None:
+        raise LegalMentionsValidationError(error)
+    return True
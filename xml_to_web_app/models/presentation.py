@@ -14,12 +14,15 @@ import re
 # Import des utilitaires XML centralisés
 from ..utils.xml_utils import (
     xml_to_string, 
-    validate_html_content, 
+    check_html_content, 
     get_text_preview,
     parse_datetime_safe,
     ValidationError
 )
 
+# Caractères interdits pour XML dans le titre et le sous-titre
+_FORBIDDEN_CHARS_RE = re.compile(r'[<>&"\'`]')
+
 
 @dataclass
 class Presentation:
@@ -123,7 +126,7 @@ class Presentation:
             Chaîne XML représentant la présentation
         """
         element = self.to_xml_element()
-        return xml_to_string(element, pretty=pretty)
+        return xml_to_string(element, pretty=pretty, in_place=True)
     
     @classmethod
     def from_xml_element(cls, element: ET.Element) -> 'Presentation':
@@ -306,18 +309,18 @@ def validate_presentation_title(title: str) -> bool:
     Raises:
         PresentationValidationError: Si le titre est invalide
     """
-    if not title or not title.strip():
+    stripped = title.strip() if title else ""
+    if not stripped:
         raise PresentationValidationError("Le titre ne peut pas être vide")
     
-    if len(title.strip()) < 2:
+    if len(stripped) < 2:
         raise PresentationValidationError("Le titre doit contenir au moins 2 caractères")
     
-    if len(title.strip()) > 200:
+    if len(stripped) > 200:
         raise PresentationValidationError("Le titre ne peut pas dépasser 200 caractères")
     
     # Vérifie les caractères interdits pour XML
-    import re
-    if re.search(r'[<>&"\'`]', title):
+    if _FORBIDDEN_CHARS_RE.search(title):
         raise PresentationValidationError("Le titre contient des caractères interdits")
     
     return True
@@ -336,15 +339,15 @@ def validate_presentation_subtitle(subtitle: Optional[str]) -> bool:
     Raises:
         PresentationValidationError: Si le sous-titre est invalide
     """
-    if subtitle is None or subtitle.strip() == "":
+    stripped = subtitle.strip() if subtitle is not None else ""
+    if not stripped:
         return True  # Le sous-titre est optionnel
     
-    if len(subtitle.strip()) > 300:
+    if len(stripped) > 300:
         raise PresentationValidationError("Le sous-titre ne peut pas dépasser 300 caractères")
     
     # Vérifie les caractères interdits pour XML
-    import re
-    if re.search(r'[<>&"\'`]', subtitle):
+    if _FORBIDDEN_CHARS_RE.search(subtitle):
         raise PresentationValidationError("Le sous-titre contient des caractères interdits")
     
     return True
@@ -363,8 +366,7 @@ def validate_presentation_content(content_html: str) -> bool:
     Raises:
         PresentationValidationError: Si le contenu est invalide
     """
-    try:
-        validate_html_content(content_html, max_length=100000)  # 100KB max pour les présentations
-        return True
-    except ValidationError as e:
-        raise PresentationValidationError(str(e))
+    error = check_html_content(content_html, max_length=100000)  # 100KB max pour les présentations
+    if error is not None:
+        raise PresentationValidationError(error)
+    return True
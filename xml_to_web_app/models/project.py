@@ -5,9 +5,11 @@ Gère la sérialisation/désérialisation XML et la validation des données.
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 import xml.etree.ElementTree as ET
 import uuid
+import re
 
 # Import des utilitaires XML centralisés
 from ..utils.xml_utils import (
@@ -20,7 +22,13 @@ from ..utils.xml_utils import (
 
 from ..utils.html_utils import truncate_html_safely
 
-@dataclass
+# Caractères interdits pour XML dans le nom d'un projet
+_FORBIDDEN_CHARS_RE = re.compile(r'[<>&"\'`]')
+
+# Forme autorisée pour un identifiant XML de projet
+_PROJECT_ID_RE = re.compile(r'[a-zA-Z][a-zA-Z0-9_]*')
+
+@dataclass(slots=True)
 class Project:
     """
     Représente un projet avec ses métadonnées et contenu HTML.
@@ -98,7 +106,7 @@ class Project:
             Chaîne XML représentant le projet
         """
         element = self.to_xml_element()
-        return xml_to_string(element, pretty=pretty)
+        return xml_to_string(element, pretty=pretty, in_place=True)
     
     @classmethod
     def from_xml_element(cls, element: ET.Element) -> 'Project':
@@ -194,6 +202,28 @@ class ProjectValidationError(Exception):
     pass
 
 
+@lru_cache(maxsize=256)
+def _check_project_name(name: str) -> Optional[str]:
+    """
+    Vérifie un nom de projet en mémorisant le verdict pour une saisie donnée.
+    
+    Returns:
+        None si le nom est valide, sinon le message d'erreur
+    """
+    stripped = name.strip() if name else ""
+    if not stripped:
+        return "Le nom du projet ne peut pas être vide"
+    
+    if len(stripped) > 100:
+        return "Le nom du projet ne peut pas dépasser 100 caractères"
+    
+    # Vérifie les caractères interdits pour XML
+    if _FORBIDDEN_CHARS_RE.search(name):
+        return "Le nom du projet contient des caractères interdits"
+    
+    return None
+
+
 def validate_project_name(name: str) -> bool:
     """
     Valide qu'un nom de projet est acceptable.
@@ -207,18 +237,32 @@ def validate_project_name(name: str) -> bool:
     Raises:
         ProjectValidationError: Si le nom est invalide
     """
-    if not name or not name.strip():
-        raise ProjectValidationError("Le nom du projet ne peut pas être vide")
+    error = _check_project_name(name)
+    if error is not None:
+        raise ProjectValidationError(error)
+    return True
+
+
+@lru_cache(maxsize=256)
+def _check_project_id(project_id: str) -> Optional[str]:
+    """
+    Vérifie un identifiant de projet en mémorisant le verdict pour une saisie donnée.
     
-    if len(name.strip()) > 100:
-        raise ProjectValidationError("Le nom du projet ne peut pas dépasser 100 caractères")
+    Returns:
+        None si l'identifiant est valide, sinon le message d'erreur
+    """
+    stripped = project_id.strip() if project_id else ""
+    if not stripped:
+        return "L'identifiant du projet ne peut pas être vide"
     
-    # Vérifie les caractères interdits pour XML
-    import re
-    if re.search(r'[<>&"\'`]', name):
-        raise ProjectValidationError("Le nom du projet contient des caractères interdits")
+    if len(stripped) > 50:
+        return "L'identifiant du projet ne peut pas dépasser 50 caractères"
     
-    return True
+    # Vérifie les caractères autorisés pour XML ID
+    if not _PROJECT_ID_RE.fullmatch(stripped):
+        return "L'identifiant doit commencer par une lettre et ne contenir que des lettres, chiffres et underscores"
+    
+    return None
 
 
 def validate_project_id(project_id: str) -> bool:
@@ -234,17 +278,9 @@ def validate_project_id(project_id: str) -> bool:
     Raises:
         ProjectValidationError: Si l'identifiant est invalide
     """
-    if not project_id or not project_id.strip():
-        raise ProjectValidationError("L'identifiant du projet ne peut pas être vide")
-    
-    if len(project_id.strip()) > 50:
-        raise ProjectValidationError("L'identifiant du projet ne peut pas dépasser 50 caractères")
-    
-    # Vérifie les caractères autorisés pour XML ID
-    import re
-    if not re.match(r'^[a-zA-Z][a-zA-Z0-9_]*$', project_id.strip()):
-        raise ProjectValidationError("L'identifiant doit commencer par une lettre et ne contenir que des lettres, chiffres et underscores")
-    
+    error = _check_project_id(project_id)
+    if error is not None:
+        raise ProjectValidationError(error)
     return True
 
 
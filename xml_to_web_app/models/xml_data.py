@@ -4,42 +4,103 @@ Gère l'analyse et la validation des données XML d'entrée.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+from typing import List, Dict, Optional, Set, FrozenSet, Tuple
 import xml.etree.ElementTree as ET
 from pathlib import Path
 import re
+import sys
 
+# Chaînes d'indentation précalculées, une par niveau de profondeur
+_INDENTS = tuple(sys.intern("\n" + "  " * depth) for depth in range(64))
 
-@dataclass
+
+def _indent_for(depth: int) -> str:
+    """Retourne la chaîne d'indentation pour une profondeur donnée."""
+    if depth < len(_INDENTS):
+        return _INDENTS[depth]
+    return "\n" + "  " * depth
+
+
+# Référence de projet dans le texte: project_xxx ou project-xxx
+_PROJECT_REF_RE = re.compile(r'project[_-](\w+)', re.IGNORECASE)
+
+# Déclaration d'encodage dans le prologue XML
+_ENCODING_DECL_RE = re.compile(r'encoding=["\']([^"\']+)["\']')
+
+
+@dataclass(slots=True)
 class XMLData:
     """
     Encapsule les données XML importées de la base de données.
     
+    Le contenu XML n'est parsé qu'au premier accès à un résultat d'analyse
+    (arbre, références de projets, validation...).
+    
     Attributes:
         file_path: Chemin vers le fichier XML original
         raw_xml: Contenu XML brut
-        parsed_data: Arbre XML parsé
-        root_element: Élément racine du XML
-        projects_referenced: Liste des identifiants de projets référencés
+        parsed_data: Arbre XML parsé (propriété, parse à la demande)
+        root_element: Élément racine du XML (propriété, parse à la demande)
+        projects_referenced: Liste des identifiants de projets référencés (propriété, parse à la demande)
         encoding: Encodage du fichier XML
-        is_valid: Indique si le XML est valide
-        validation_errors: Liste des erreurs de validation
+        is_valid: Indique si le XML est valide (propriété, parse à la demande)
+        validation_errors: Liste des erreurs de validation (propriété, parse à la demande)
     """
     
     file_path: Optional[Path] = None
     raw_xml: str = ""
-    parsed_data: Optional[ET.ElementTree] = None
-    root_element: Optional[ET.Element] = None
-    projects_referenced: List[str] = field(default_factory=list)
     encoding: str = "utf-8"
-    is_valid: bool = False
-    validation_errors: List[str] = field(default_factory=list)
+    _projects_referenced: List[str] = field(default_factory=list, init=False, repr=False)
+    _is_valid: bool = field(default=False, init=False, repr=False)
+    _validation_errors: List[str] = field(default_factory=list, init=False, repr=False)
+    _parsed_data: Optional[ET.ElementTree] = field(default=None, init=False, repr=False)
+    _root_element: Optional[ET.Element] = field(default=None, init=False, repr=False)
+    _parsed: bool = field(default=False, init=False, repr=False)
+    _referenced_cache: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False)
     
-    def __post_init__(self):
-        """Initialise les données après création."""
-        if self.raw_xml:
+    @property
+    def parsed_data(self) -> Optional[ET.ElementTree]:
+        """Arbre XML parsé (le parsing a lieu au premier accès)."""
+        self._ensure_parsed()
+        return self._parsed_data
+    
+    @property
+    def root_element(self) -> Optional[ET.Element]:
+        """Élément racine du XML (le parsing a lieu au premier accès)."""
+        self._ensure_parsed()
+        return self._root_element
+    
+    @property
+    def projects_referenced(self) -> List[str]:
+        """Identifiants de projets référencés (le parsing a lieu au premier accès)."""
+        self._ensure_parsed()
+        return self._projects_referenced
+    
+    @property
+    def is_valid(self) -> bool:
+        """Indique si le XML est valide (le parsing a lieu au premier accès)."""
+        self._ensure_parsed()
+        return self._is_valid
+    
+    @property
+    def validation_errors(self) -> List[str]:
+        """Erreurs de validation (le parsing a lieu au premier accès)."""
+        self._ensure_parsed()
+        return self._validation_errors
+    
+    def _ensure_parsed(self) -> None:
+        """Parse le contenu XML s'il ne l'a pas encore été."""
+        if not self._parsed and self.raw_xml:
             self.parse_xml()
     
+    @property
+    def _referenced_set(self) -> FrozenSet[str]:
+        """Ensemble figé des projets référencés (calculé une seule fois par parsing)."""
+        self._ensure_parsed()
+        if self._referenced_cache is None:
+            self._referenced_cache = frozenset(self._projects_referenced)
+        return self._referenced_cache
+    
     @classmethod
     def from_file(cls, file_path: str | Path) -> 'XMLData':
         """
@@ -82,16 +143,27 @@ class XMLData:
         )
     
     @classmethod
-    def from_string(cls, xml_content: str) -> 'XMLData':
+    def from_string(cls, xml_content: str | bytes) -> 'XMLData':
         """
         Crée une instance XMLData à partir d'une chaîne XML.
         
         Args:
-            xml_content: Contenu XML
+            xml_content: Contenu XML (texte, ou octets décodés selon la déclaration XML)
             
         Returns:
             Instance XMLData
         """
+        if isinstance(xml_content, bytes):
+            first_line = xml_content[:200].split(b'\n', 1)[0].decode('utf-8', errors='ignore')
+            encoding_match = _ENCODING_DECL_RE.search(first_line)
+            encoding = encoding_match.group(1).lower() if encoding_match else 'utf-8'
+            try:
+                content = xml_content.decode(encoding)
+            except (UnicodeDecodeError, LookupError):
+                content = xml_content.decode('utf-8', errors='replace')
+                encoding = 'utf-8'
+            return cls(raw_xml=content, encoding=encoding)
+        
         return cls(raw_xml=xml_content)
     
     @staticmethod
@@ -111,7 +183,7 @@ class XMLData:
                 first_line = f.readline().decode('utf-8', errors='ignore')
                 
             # Cherche la déclaration d'encodage
-            encoding_match = re.search(r'encoding=["\']([^"\']+)["\']', first_line)
+            encoding_match = _ENCODING_DECL_RE.search(first_line)
             if encoding_match:
                 return encoding_match.group(1).lower()
         except Exception:
@@ -127,17 +199,19 @@ class XMLData:
         Returns:
             True si le parsing s'est bien passé, False sinon
         """
-        self.validation_errors.clear()
+        self._parsed = True
+        self._referenced_cache = None
+        self._validation_errors.clear()
         
         if not self.raw_xml.strip():
-            self.validation_errors.append("Contenu XML vide")
-            self.is_valid = False
+            self._validation_errors.append("Contenu XML vide")
+            self._is_valid = False
             return False
         
         try:
             # Parse le XML
-            self.parsed_data = ET.ElementTree(ET.fromstring(self.raw_xml))
-            self.root_element = self.parsed_data.getroot()
+            self._parsed_data = ET.ElementTree(ET.fromstring(self.raw_xml))
+            self._root_element = self._parsed_data.getroot()
             
             # Extrait les références de projets
             self._extract_project_references()
@@ -145,16 +219,16 @@ class XMLData:
             # Valide la structure
             self._validate_structure()
             
-            self.is_valid = len(self.validation_errors) == 0
-            return self.is_valid
+            self._is_valid = len(self._validation_errors) == 0
+            return self._is_valid
             
         except ET.ParseError as e:
-            self.validation_errors.append(f"Erreur de parsing XML: {e}")
-            self.is_valid = False
+            self._validation_errors.append(f"Erreur de parsing XML: {e}")
+            self._is_valid = False
             return False
         except Exception as e:
-            self.validation_errors.append(f"Erreur inattendue: {e}")
-            self.is_valid = False
+            self._validation_errors.append(f"Erreur inattendue: {e}")
+            self._is_valid = False
             return False
     
     def _extract_project_references(self) -> None:
@@ -178,24 +252,23 @@ class XMLData:
             if elem.text:
                 # Utilise une regex pour trouver des références de projets
                 # Format supposé: project_xxx ou des mots-clés spécifiques
-                project_refs = re.findall(r'project[_-](\w+)', elem.text, re.IGNORECASE)
-                project_ids.update(project_refs)
+                project_ids.update(_PROJECT_REF_RE.findall(elem.text))
         
-        self.projects_referenced = sorted(list(project_ids))
+        self._projects_referenced = sorted(list(project_ids))
     
     def _validate_structure(self) -> None:
         """Valide la structure basique du XML."""
         if not self.root_element:
-            self.validation_errors.append("Pas d'élément racine trouvé")
+            self._validation_errors.append("Pas d'élément racine trouvé")
             return
         
         # Validation basique de la structure
         if len(list(self.root_element)) == 0:
-            self.validation_errors.append("Le XML ne contient aucun élément enfant")
+            self._validation_errors.append("Le XML ne contient aucun élément enfant")
         
         # Vérifie que le XML n'est pas trop volumineux
         if len(self.raw_xml) > 10 * 1024 * 1024:  # 10MB max
-            self.validation_errors.append("Fichier XML trop volumineux (max 10MB)")
+            self._validation_errors.append("Fichier XML trop volumineux (max 10MB)")
     
     def get_project_references(self) -> List[str]:
         """
@@ -204,6 +277,7 @@ class XMLData:
         Returns:
             Liste des identifiants de projets
         """
+        self._ensure_parsed()
         return self.projects_referenced.copy()
     
     def has_project_reference(self, project_id: str) -> bool:
@@ -216,7 +290,26 @@ class XMLData:
         Returns:
             True si le projet est référencé
         """
-        return project_id in self.projects_referenced
+        return project_id in self._referenced_set
+    
+    def diff_against(self, available_projects: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Compare les projets référencés avec les projets disponibles.
+        
+        Args:
+            available_projects: Projets disponibles (liste ou ensemble)
+            
+        Returns:
+            Tuple (projets manquants, projets non utilisés), chacun trié
+        """
+        referenced_set = self._referenced_set
+        if isinstance(available_projects, (set, frozenset)):
+            available_set = available_projects
+        else:
+            available_set = frozenset(available_projects)
+        missing = sorted(referenced_set - available_set)
+        unused = sorted(available_set - referenced_set)
+        return missing, unused
     
     def get_missing_projects(self, available_projects: List[str]) -> List[str]:
         """
@@ -228,9 +321,7 @@ class XMLData:
         Returns:
             Liste des projets manquants
         """
-        available_set = set(available_projects)
-        referenced_set = set(self.projects_referenced)
-        return sorted(list(referenced_set - available_set))
+        return sorted(self._referenced_set.difference(available_projects))
     
     def get_unused_projects(self, available_projects: List[str]) -> List[str]:
         """
@@ -242,9 +333,7 @@ class XMLData:
         Returns:
             Liste des projets non utilisés
         """
-        available_set = set(available_projects)
-        referenced_set = set(self.projects_referenced)
-        return sorted(list(available_set - referenced_set))
+        return sorted(frozenset(available_projects) - self._referenced_set)
     
     def get_statistics(self) -> Dict[str, any]:
         """
@@ -253,6 +342,7 @@ class XMLData:
         Returns:
             Dictionnaire contenant les statistiques
         """
+        self._ensure_parsed()
         stats = {
             'file_size_bytes': len(self.raw_xml),
             'file_size_kb': len(self.raw_xml) / 1024,
@@ -293,20 +383,30 @@ class XMLData:
             self.parsed_data.write(f, encoding='unicode', xml_declaration=False)
     
     def _indent_xml(self, elem: ET.Element, level: int = 0) -> None:
-        """Ajoute l'indentation au XML pour le rendre lisible."""
-        i = "\n" + level * "  "
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + "  "
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for child in elem:
-                self._indent_xml(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
+        """
+        Ajoute l'indentation au XML pour le rendre lisible.
+        
+        Parcours itératif (pile explicite) pour éviter les RecursionError
+        sur les documents très profonds.
+        """
+        stack = [(elem, level, False)]
+        while stack:
+            node, depth, is_last = stack.pop()
+            
+            if len(node):
+                if not node.text or not node.text.strip():
+                    node.text = _indent_for(depth + 1)
+                children = list(node)
+                last_index = len(children) - 1
+                for index in range(last_index, -1, -1):
+                    stack.append((children[index], depth + 1, index == last_index))
+            
+            if not node.tail or not node.tail.strip():
+                if is_last:
+                    # Le dernier enfant se referme au niveau de son parent
+                    node.tail = _indent_for(depth - 1)
+                elif depth or len(node):
+                    node.tail = _indent_for(depth)
     
     def validate(self) -> bool:
         """
@@ -315,7 +415,7 @@ class XMLData:
         Returns:
             True si valide, False sinon
         """
-        if not self.is_valid:
+        if not self._parsed or not self.is_valid:
             self.parse_xml()
         
         return self.is_valid
@@ -327,6 +427,7 @@ class XMLData:
         Returns:
             Rapport de validation formaté
         """
+        self._ensure_parsed()
         report = []
         report.append("=== RAPPORT DE VALIDATION XML ===")
         
@@ -353,11 +454,13 @@ class XMLData:
     
     def __str__(self) -> str:
         """Représentation textuelle des données XML."""
+        self._ensure_parsed()
         status = "✓" if self.is_valid else "✗"
         return f"XMLData({status}, {len(self.projects_referenced)} projets référencés)"
     
     def __repr__(self) -> str:
         """Représentation détaillée des données XML."""
+        self._ensure_parsed()
         return (f"XMLData(file_path={self.file_path}, "
                 f"is_valid={self.is_valid}, "
                 f"projects_count={len(self.projects_referenced)})")
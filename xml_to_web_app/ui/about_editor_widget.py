@@ -5,8 +5,10 @@ Permet l'édition du contenu HTML de la page à propos avec un éditeur WYSIWYG.
 Cette interface se présente sous la forme d'une classe qui hérite de BaseEditor.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import QVBoxLayout, QLabel, QGroupBox, QFormLayout
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from .base_editor import BaseEditorWidget
 from ..models.about import About, AboutValidationError, validate_about_content
@@ -31,20 +33,36 @@ class AboutEditorWidget(BaseEditorWidget):
         info_layout = QFormLayout(info_group)
 
         # Informations en lecture seule (pour projets existants)
+        self.updated_label: Optional[QLabel] = None
+        self._last_updated_at = None
         if not self._is_new_data:
             self.updated_label = QLabel(format_french_datetime(self._data.updated_at))
+            self._last_updated_at = self._data.updated_at
             info_layout.addRow("Modifié le:", self.updated_label)
         
         parent_layout.addWidget(title)
         parent_layout.addWidget(info_group)
 
+    def _setup_specific_connections(self) -> None:
+        """Valide le contenu HTML après une pause dans la saisie."""
+        self._validate_timer = QTimer(self)
+        self._validate_timer.setSingleShot(True)
+        self._validate_timer.setInterval(250)
+        self._validate_timer.timeout.connect(self._validate_data)
+
+    def _on_html_tab_created(self) -> None:
+        """Relance la validation différée à chaque modification du HTML."""
+        self.html_editor.textChanged.connect(self._validate_timer.start)
+
     def _load_data(self) -> None:
         """Charge les données de la page à propos dans l'interface."""
         if not self._data:
             return
         
         # Met à jour les informations de lecture seule
-        self.updated_label.setText(format_french_datetime(self._data.updated_at))
+        if self.updated_label is not None:
+            self.updated_label.setText(format_french_datetime(self._data.updated_at))
+            self._last_updated_at = self._data.updated_at
         
         self._update_status(f"Chargement de la page à propos")
     
@@ -52,25 +70,31 @@ class AboutEditorWidget(BaseEditorWidget):
         """Charge le contenu initial de l'à propos."""
         if self._data and self._data.content_html:
             self.wysiwyg_editor.load_content(self._data.content_html)
-            self.html_editor.setPlainText(self._data.content_html)
-            self._initial_content_loaded = True
+            self._set_html_text(self._data.content_html)
+            self._state.initial_content_loaded = True
             self._update_status(f"A propos de l'édition chargé")
         else:
             self._update_status("A propos par défaut prêt")
 
     def _validate_data(self) -> bool:
         """Valide le contenu HTML."""
-        content = self.html_editor.toPlainText()
+        content = self._get_html_text()
         try:
             validate_about_content(content)
-            self.html_editor.setStyleSheet("")
+            if self._html_editor is not None:
+                self._set_invalid(self._html_editor, False)
             return True
         except AboutValidationError as e:
-            self.html_editor.setStyleSheet("border: 2px solid #dc3545;")
+            if self._html_editor is not None:
+                self._set_invalid(self._html_editor, True)
             self._update_status(f"Contenu HTML invalide : {e}")
             return False
 
     
+    def _is_content_unchanged(self, content: str) -> bool:
+        """Compare au contenu stocké, après le même strip() que update_content."""
+        return self._data is not None and content.strip() == self._data.content_html
+
     def _save_data(self, content: str) -> About:
         """
         Sauvegarde l'à propos avec le contenu spécifié.
@@ -81,7 +105,6 @@ class AboutEditorWidget(BaseEditorWidget):
         Returns:
             L'à propos sauvegardé
         """
-        
         try:
             # Valide le contenu HTML
             validate_about_content(content)
@@ -103,8 +126,12 @@ class AboutEditorWidget(BaseEditorWidget):
     def _on_data_saved_success(self, saved_data: About) -> None:
         """Met à jour l'interface après une sauvegarde réussie."""
         # Met à jour les informations affichées
-        if hasattr(self, 'updated_label'):
+        if self.updated_label is not None:
+            # Évite de redessiner le label si la date affichée n'a pas changé
+            if saved_data.updated_at == self._last_updated_at:
+                return
             self.updated_label.setText(format_french_datetime(saved_data.updated_at))
+            self._last_updated_at = saved_data.updated_at
     
     def _get_help_text(self) -> str:
         """Retourne le texte d'aide spécifique à l'à propos."""
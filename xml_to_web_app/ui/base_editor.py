@@ -3,10 +3,12 @@ Superclasse pour les interfaces d'édition de l'application XML to Web.
 Fournit les fonctionnalités communes pour l'édition de contenu avec éditeur WYSIWYG.
 """
 
+import inspect
 import logging
+import weakref
 from abc import ABCMeta, abstractmethod
-from typing import Optional, Callable, Any
-from PySide6.QtCore import Signal
+from typing import Optional, Callable, Any, Dict, Set
+from PySide6.QtCore import Qt, Signal, QTimer, QSignalBlocker
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QTextEdit, QTabWidget, QWidget,
@@ -16,12 +18,73 @@ from PySide6.QtWidgets import (
 from PySide6.QtGui import QFont, QKeySequence, QShortcut
 
 from .wysiwyg_editor import WysiwygEditor
+from ..utils.xml_utils import _validate_html_structure
 
-class MetaQWidgetABC(type(QWidget), ABCMeta):
-    """Métaclasse combinée pour résoudre le conflit entre QDialog et ABC."""
+# Textes et styles des indicateurs d'état, partagés par toutes les instances
+_UNSAVED_TEXT = "● Modifications non sauvegardées"
+_UNSAVED_CSS = "color: #dc3545; font-weight: bold;"
+_SAVED_TEXT = "✓ Sauvegardé"
+_SAVED_CSS = "color: #28a745;"
+_INFO_LABEL_CSS = "color: #666; font-style: italic;"
+_READY_CSS = "color: #28a745;"
+
+# Texte d'aide commun, construit une seule fois pour toutes les instances
+_BASE_HELP_TEXT = """
+<h3>Aide - Éditeur</h3>
+
+<h4>Raccourcis clavier :</h4>
+<ul>
+<li><b>Ctrl+S</b> : Sauvegarder</li>
+<li><b>Ctrl+Q</b> : Annuler</li>
+<li><b>F1</b> : Afficher cette aide</li>
+</ul>
+
+<h4>Utilisation :</h4>
+<ul>
+<li><b>Éditeur Visuel</b> : Édition WYSIWYG avec formatage</li>
+<li><b>Code HTML</b> : Édition directe du code HTML</li>
+<li><b>Synchronisation</b> : Utilisez les boutons pour synchroniser entre les deux modes</li>
+</ul>
+
+<h4>Validation :</h4>
+<ul>
+<li>Le contenu HTML est validé automatiquement</li>
+<li>Les changements non sauvegardés sont indiqués</li>
+</ul>
+"""
+
+
+# Textes d'aide complets (texte commun + spécificités), mis en cache par classe d'éditeur
+_HELP_TEXT_CACHE: Dict[type, str] = {}
+
+
+class _EditorState:
+    """État d'édition d'un BaseEditorWidget, stocké dans des slots plutôt qu'un dictionnaire."""
+    
+    __slots__ = (
+        "has_unsaved_changes", "editor_ready", "initial_content_loaded",
+        "auto_save_enabled", "dirty_tabs", "last_unsaved_state"
+    )
+    
+    def __init__(self):
+        self.has_unsaved_changes = False
+        self.editor_ready = False
+        self.initial_content_loaded = False
+        self.auto_save_enabled = True
+        # Onglets modifiés depuis la dernière sauvegarde (0 : WYSIWYG, 1 : HTML)
+        self.dirty_tabs: Set[int] = set()
+        # Dernier état affiché par l'indicateur de changements non sauvegardés
+        self.last_unsaved_state: Optional[bool] = None
+
+
+class _QtABCMeta(type(QWidget), ABCMeta):
+    """
+    Métaclasse combinée pour résoudre le conflit entre Qt et ABC.
+    type(QWidget) et type(QDialog) sont identiques : elle sert aux deux classes de base.
+    """
     pass
 
-class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
+class BaseEditorWidget(QWidget, metaclass=_QtABCMeta):
     """
     Widget de base pour les interfaces d'édition avec éditeur WYSIWYG.
     
@@ -49,6 +112,13 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
     editing_cancelled = Signal()
     help_requested = Signal()
     
+    # Police monospace de l'éditeur HTML, créée au premier besoin
+    _html_font: Optional[QFont] = None
+    
+    # Libellés du bouton de sauvegarde
+    _SAVE_TEXT_NEW = "Enregistrer"
+    _SAVE_TEXT_EDIT = "Mettre à jour"
+    
     def __init__(self, data: Optional[Any] = None, parent: Optional[QWidget] = None,
                  show_action_buttons: bool = True):
         """
@@ -64,14 +134,24 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         self._logger = logging.getLogger(self.__class__.__name__)
         self._data = data
         self._is_new_data = data is None
-        self._has_unsaved_changes = False
-        self._auto_save_enabled = True
-        self._content_change_callback: Optional[Callable[[str], None]] = None
+        # État d'édition regroupé dans un conteneur à slots (accès rapide depuis les slots de frappe)
+        self._state = _EditorState()
+        # Référence (faible pour les méthodes liées) vers le callback de changement de contenu
+        self._content_change_callback: Optional[Callable[[], Optional[Callable[[str], None]]]] = None
         self._show_action_buttons = show_action_buttons
         
-        # État de l'éditeur
-        self._editor_ready = False
-        self._initial_content_loaded = False
+        # Dernier contenu HTML validé et son verdict (None si valide)
+        self._last_html_check: tuple = (None, None)
+        
+        # Boîtes de message réutilisées, une par niveau de gravité (créées au premier usage)
+        self._message_boxes: Dict[QMessageBox.Icon, QMessageBox] = {}
+        
+        # Regroupe les notifications de modification d'une même rafale de frappe
+        self._pending_content: Optional[str] = None
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(150)
+        self._change_timer.timeout.connect(self._flush_content_changed)
         
         self._setup_ui()
         self._setup_connections()
@@ -81,10 +161,19 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         self._initialize_data()
 
         self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Maximum)
-        self.adjustSize()
+        
+        # Le calcul de taille est différé au premier affichage
+        self._sized = False
         
         self._logger.info(f"{self.__class__.__name__} initialisé - {'Nouvelles données' if self._is_new_data else 'Données existantes'}")
     
+    def showEvent(self, event) -> None:
+        """Ajuste la taille du widget lors de son premier affichage."""
+        if not self._sized:
+            self.adjustSize()
+            self._sized = True
+        super().showEvent(event)
+    
     def _setup_ui(self) -> None:
         """Configure l'interface utilisateur commune."""
         # Layout principal
@@ -92,18 +181,23 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         main_layout.setSpacing(10)
         main_layout.setContentsMargins(10, 10, 10, 10)
         
-        # Section d'informations spécifiques (implémentée par les classes filles)
-        self._create_info_section(main_layout)
-        
-        # Section éditeur commune
-        self._create_editor_section(main_layout)
-        
-        # Barre de statut commune
-        self._create_status_section(main_layout)
-        
-        # Boutons d'action communs (optionnels)
-        if self._show_action_buttons:
-            self._create_action_buttons(main_layout)
+        # Suspend les mises à jour pendant la construction : un seul passage de mise en page
+        self.setUpdatesEnabled(False)
+        try:
+            # Section d'informations spécifiques (implémentée par les classes filles)
+            self._create_info_section(main_layout)
+            
+            # Section éditeur commune
+            self._create_editor_section(main_layout)
+            
+            # Barre de statut commune
+            self._create_status_section(main_layout)
+            
+            # Boutons d'action communs (optionnels)
+            if self._show_action_buttons:
+                self._create_action_buttons(main_layout)
+        finally:
+            self.setUpdatesEnabled(True)
     
     @abstractmethod
     def _create_info_section(self, parent_layout: QVBoxLayout) -> None:
@@ -128,8 +222,10 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         # Onglet éditeur WYSIWYG
         self._create_wysiwyg_tab()
         
-        # Onglet éditeur HTML brut
-        self._create_html_tab()
+        # Onglet éditeur HTML brut, construit à son premier affichage
+        self._html_editor: Optional[QTextEdit] = None
+        self._pending_html: Optional[str] = None
+        self.tab_widget.addTab(QWidget(), "Code HTML")
         
         editor_layout.addWidget(self.tab_widget)
         parent_layout.addWidget(editor_group)
@@ -147,7 +243,7 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         
         # Boutons de l'éditeur
         self.wysiwyg_status_label = QLabel("Initialisation de l'éditeur...")
-        self.wysiwyg_status_label.setStyleSheet("color: #666; font-style: italic;")
+        self.wysiwyg_status_label.setStyleSheet(_INFO_LABEL_CSS)
         toolbar_layout.addWidget(self.wysiwyg_status_label)
         
         toolbar_layout.addStretch()
@@ -169,8 +265,15 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         
         self.tab_widget.addTab(wysiwyg_widget, "Éditeur Visuel")
     
+    @property
+    def html_editor(self) -> QTextEdit:
+        """Éditeur HTML brut (l'onglet est construit au premier accès)."""
+        if self._html_editor is None:
+            self._create_html_tab()
+        return self._html_editor
+    
     def _create_html_tab(self) -> None:
-        """Crée l'onglet de l'éditeur HTML brut."""
+        """Crée l'onglet de l'éditeur HTML brut à la place de l'onglet provisoire."""
         html_widget = QWidget()
         html_layout = QVBoxLayout(html_widget)
         html_layout.setContentsMargins(0, 0, 0, 0)
@@ -182,7 +285,7 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         
         # Informations
         html_info_label = QLabel("Édition HTML directe")
-        html_info_label.setStyleSheet("color: #666; font-style: italic;")
+        html_info_label.setStyleSheet(_INFO_LABEL_CSS)
         html_toolbar_layout.addWidget(html_info_label)
         
         html_toolbar_layout.addStretch()
@@ -200,17 +303,75 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         html_layout.addWidget(html_toolbar_frame)
         
         # Éditeur HTML brut
-        self.html_editor = QTextEdit()
-        self.html_editor.setPlaceholderText("Saisissez votre contenu HTML ici...")
+        self._html_editor = QTextEdit()
+        self._html_editor.setPlaceholderText("Saisissez votre contenu HTML ici...")
+        
+        # Police monospace pour le HTML, partagée par tous les éditeurs
+        if BaseEditorWidget._html_font is None:
+            font = QFont("Consolas", 10)
+            font.setStyleHint(QFont.StyleHint.Monospace)
+            BaseEditorWidget._html_font = font
+        self._html_editor.setFont(BaseEditorWidget._html_font)
+        
+        html_layout.addWidget(self._html_editor)
+        
+        # Remplace l'onglet provisoire sans déclencher de changement d'onglet
+        current_index = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(1)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(1)
+        self.tab_widget.insertTab(1, html_widget, "Code HTML")
+        self.tab_widget.setCurrentIndex(current_index)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+        
+        # Contenu chargé avant la construction de l'onglet
+        if self._pending_html is not None:
+            self._set_html_text(self._pending_html)
+            self._pending_html = None
+        
+        self._html_editor.textChanged.connect(self._on_html_editor_changed)
+        self._on_html_tab_created()
+    
+    def _on_html_tab_created(self) -> None:
+        """
+        Callback appelé une fois l'onglet HTML construit.
+        Méthode vide par défaut, à surcharger pour connecter l'éditeur HTML.
+        """
+        pass
+    
+    def _set_html_text(self, content: str) -> None:
+        """
+        Charge un contenu dans l'éditeur HTML sans le marquer comme modifié.
+        Si l'onglet n'est pas encore construit, le contenu est mis en attente.
         
-        # Police monospace pour le HTML
-        font = QFont("Consolas", 10)
-        font.setStyleHint(QFont.StyleHint.Monospace)
-        self.html_editor.setFont(font)
+        Args:
+            content: Contenu HTML à charger
+        """
+        if self._html_editor is None:
+            self._pending_html = content
+            return
         
-        html_layout.addWidget(self.html_editor)
+        # Contenu identique : évite de reconstruire le document et de perdre l'historique
+        if self._html_editor.toPlainText() == content:
+            return
         
-        self.tab_widget.addTab(html_widget, "Code HTML")
+        blocker = QSignalBlocker(self._html_editor)
+        try:
+            self._html_editor.setPlainText(content)
+        finally:
+            blocker.unblock()
+    
+    def _get_html_text(self) -> str:
+        """
+        Retourne le contenu de l'éditeur HTML sans forcer sa construction.
+        
+        Returns:
+            Contenu HTML brut
+        """
+        if self._html_editor is None:
+            return self._pending_html or ""
+        return self._html_editor.toPlainText()
     
     def _create_status_section(self, parent_layout: QVBoxLayout) -> None:
         """Crée la barre de statut commune."""
@@ -220,16 +381,27 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         self.unsaved_label = QLabel()
         self.status_bar.addPermanentWidget(self.unsaved_label)
         
-        # Barre de progression pour les opérations
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setMaximumWidth(200)
-        self.status_bar.addPermanentWidget(self.progress_bar)
+        # Barre de progression créée seulement si une opération longue démarre
+        self._progress_bar: Optional[QProgressBar] = None
         
         parent_layout.addWidget(self.status_bar)
         
         self._update_status("Prêt")
     
+    def _get_progress_bar(self) -> QProgressBar:
+        """
+        Retourne la barre de progression de la barre de statut, créée au premier appel.
+        
+        Returns:
+            La barre de progression (masquée à sa création)
+        """
+        if self._progress_bar is None:
+            self._progress_bar = QProgressBar()
+            self._progress_bar.setVisible(False)
+            self._progress_bar.setMaximumWidth(200)
+            self.status_bar.addPermanentWidget(self._progress_bar)
+        return self._progress_bar
+    
     def _create_action_buttons(self, parent_layout: QVBoxLayout) -> None:
         """Crée les boutons d'action communs."""
         button_layout = QHBoxLayout()
@@ -262,9 +434,6 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         self.wysiwyg_editor.content_changed.connect(self._on_wysiwyg_content_changed)
         self.wysiwyg_editor.save_requested.connect(self._on_save_requested)
         
-        # Connexions pour l'éditeur HTML
-        self.html_editor.textChanged.connect(self._on_html_editor_changed)
-        
         # Connexions pour les onglets
         self.tab_widget.currentChanged.connect(self._on_tab_changed)
         
@@ -280,17 +449,19 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
     
     def _setup_shortcuts(self) -> None:
         """Configure les raccourcis clavier communs."""
-        # Ctrl+S pour sauvegarder
-        save_shortcut = QShortcut(QKeySequence.StandardKey.Save, self)
-        save_shortcut.activated.connect(self._save_data_wrapper)
-        
-        # Ctrl+Q pour annuler
-        cancel_shortcut = QShortcut(QKeySequence("Ctrl+Q"), self)
-        cancel_shortcut.activated.connect(self._cancel_editing)
-        
-        # F1 pour l'aide
-        help_shortcut = QShortcut(QKeySequence.StandardKey.HelpContents, self)
-        help_shortcut.activated.connect(self._show_help)
+        shortcut_specs = [
+            (QKeySequence.StandardKey.Save, self._save_data_wrapper),      # Ctrl+S pour sauvegarder
+            (QKeySequence("Ctrl+Q"), self._cancel_editing),                # Ctrl+Q pour annuler
+            (QKeySequence.StandardKey.HelpContents, self._show_help),      # F1 pour l'aide
+        ]
+        
+        # Limités à l'éditeur qui a le focus pour ne pas déclencher les autres éditeurs ouverts
+        self._shortcuts = []
+        for key_sequence, callback in shortcut_specs:
+            shortcut = QShortcut(key_sequence, self)
+            shortcut.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+            shortcut.activated.connect(callback)
+            self._shortcuts.append(shortcut)
     
     def _initialize_data(self) -> None:
         """Initialise les données (charge ou crée)."""
@@ -317,13 +488,13 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
     
     def _on_wysiwyg_ready(self) -> None:
         """Callback appelé quand l'éditeur WYSIWYG est prêt."""
-        self._editor_ready = True
+        self._state.editor_ready = True
         self.wysiwyg_status_label.setText("Éditeur prêt")
-        self.wysiwyg_status_label.setStyleSheet("color: #28a745;")
+        self.wysiwyg_status_label.setStyleSheet(_READY_CSS)
         self.sync_button.setEnabled(True)
         
         # Charge le contenu initial si des données existent
-        if self._data and not self._initial_content_loaded:
+        if self._data and not self._state.initial_content_loaded:
             self._load_initial_content()
         
         self._logger.info("Éditeur WYSIWYG prêt")
@@ -338,17 +509,36 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
     
     def _on_wysiwyg_content_changed(self, content: str) -> None:
         """Callback appelé quand le contenu WYSIWYG change."""
-        self._mark_as_changed()
-        
-        if self._content_change_callback:
-            self._content_change_callback(content)
+        self._state.dirty_tabs.add(0)
+        self._pending_content = content
+        self._change_timer.start()
     
     def _on_html_editor_changed(self) -> None:
         """Callback appelé quand le contenu HTML brut change."""
+        self._state.dirty_tabs.add(1)
+        self._change_timer.start()
+    
+    def _flush_content_changed(self) -> None:
+        """Traite les modifications accumulées depuis la dernière notification."""
+        self._change_timer.stop()
         self._mark_as_changed()
+        
+        content, self._pending_content = self._pending_content, None
+        if content is not None and self._content_change_callback:
+            callback = self._content_change_callback()
+            if callback is not None:
+                callback(content)
+    
+    def _flush_pending_changes(self) -> None:
+        """Applique immédiatement les modifications en attente de traitement."""
+        if self._change_timer.isActive():
+            self._flush_content_changed()
     
     def _on_tab_changed(self, index: int) -> None:
         """Callback appelé quand l'onglet actif change."""
+        if index == 1 and self._html_editor is None:
+            self._create_html_tab()
+        
         if index == 0:  # Onglet WYSIWYG
             self._update_status("Éditeur visuel actif")
         elif index == 1:  # Onglet HTML
@@ -356,23 +546,28 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
     
     def _on_save_requested(self) -> None:
         """Callback appelé quand une sauvegarde est demandée."""
-        if self._auto_save_enabled:
+        if self._state.auto_save_enabled:
             self._save_data_wrapper()
     
     def _mark_as_changed(self) -> None:
         """Marque les données comme ayant des changements non sauvegardés."""
-        if not self._has_unsaved_changes:
-            self._has_unsaved_changes = True
+        if not self._state.has_unsaved_changes:
+            self._state.has_unsaved_changes = True
             self._update_unsaved_indicator()
     
     def _update_unsaved_indicator(self) -> None:
         """Met à jour l'indicateur de changements non sauvegardés."""
-        if self._has_unsaved_changes:
-            self.unsaved_label.setText("● Modifications non sauvegardées")
-            self.unsaved_label.setStyleSheet("color: #dc3545; font-weight: bold;")
+        state = self._state
+        if state.last_unsaved_state == state.has_unsaved_changes:
+            return
+        state.last_unsaved_state = state.has_unsaved_changes
+        
+        if state.has_unsaved_changes:
+            self.unsaved_label.setText(_UNSAVED_TEXT)
+            self.unsaved_label.setStyleSheet(_UNSAVED_CSS)
         else:
-            self.unsaved_label.setText("✓ Sauvegardé")
-            self.unsaved_label.setStyleSheet("color: #28a745;")
+            self.unsaved_label.setText(_SAVED_TEXT)
+            self.unsaved_label.setStyleSheet(_SAVED_CSS)
     
     @abstractmethod
     def _validate_data(self) -> bool:
@@ -389,62 +584,98 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         """Valide le contenu HTML."""
         html_content = self.html_editor.toPlainText()
         
-        try:
-            # Validation basique - à adapter selon vos besoins
-            if not html_content.strip():
-                raise ValueError("Le contenu HTML ne peut pas être vide")
-            
-            QMessageBox.information(self, "Validation HTML", "Le code HTML est valide.")
-            self.html_editor.setStyleSheet("")
-        except Exception as e:
-            QMessageBox.warning(self, "HTML Invalide", f"Erreur de validation HTML:\n{e}")
-            self.html_editor.setStyleSheet("border: 2px solid #dc3545;")
+        # Verdict mémorisé si le contenu n'a pas changé depuis la dernière validation
+        if self._last_html_check[0] != html_content:
+            try:
+                if not html_content.strip():
+                    raise ValueError("Le contenu HTML ne peut pas être vide")
+                _validate_html_structure(html_content)
+                error = None
+            except Exception as e:
+                error = str(e)
+            self._last_html_check = (html_content, error)
+        
+        error = self._last_html_check[1]
+        if error is None:
+            self._show_message(QMessageBox.Icon.Information, "Validation HTML", "Le code HTML est valide.")
+            self._set_invalid(self.html_editor, False)
+        else:
+            self._show_message(QMessageBox.Icon.Warning, "HTML Invalide", f"Erreur de validation HTML:\n{error}")
+            self._set_invalid(self.html_editor, True)
+    
+    def _set_invalid(self, widget: QWidget, invalid: bool) -> None:
+        """
+        Marque un champ comme invalide via la propriété dynamique « invalid »,
+        mise en forme par une règle de style.qss. Le style n'est repoli que si l'état change.
+        
+        Args:
+            widget: Champ à marquer
+            invalid: True si le contenu du champ est invalide
+        """
+        if bool(widget.property("invalid")) == invalid:
+            return
+        widget.setProperty("invalid", invalid)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
     
     def _sync_to_html_tab(self) -> None:
         """Synchronise le contenu WYSIWYG vers l'onglet HTML."""
-        if self._editor_ready:
+        if self._state.editor_ready:
             self.wysiwyg_editor.get_content(self._on_content_for_sync)
     
     def _on_content_for_sync(self, content: str) -> None:
         """Callback pour la synchronisation vers HTML."""
-        self.html_editor.setPlainText(content)
+        self._set_html_text(content)
+        self._state.dirty_tabs = {1}
         self._update_status("Contenu synchronisé vers HTML")
     
     def _sync_from_html_tab(self) -> None:
         """Synchronise le contenu HTML vers l'éditeur WYSIWYG."""
-        if self._editor_ready:
+        if self._state.editor_ready:
             html_content = self.html_editor.toPlainText()
             self.wysiwyg_editor.load_content(html_content)
+            self._state.dirty_tabs = {0}
             self._update_status("Contenu synchronisé vers l'éditeur visuel")
     
     def _save_data_wrapper(self) -> None:
         """Méthode wrapper pour la sauvegarde."""
+        self._flush_pending_changes()
+        
         if not self._validate_data():
             return
         
         # Récupère le contenu depuis l'éditeur actif
         if self.tab_widget.currentIndex() == 0:  # WYSIWYG
-            if self._editor_ready:
-                self.wysiwyg_editor.get_content(self._on_content_for_save)
+            if self._state.dirty_tabs == {1}:
+                # Seul le HTML a été modifié : inutile d'interroger l'éditeur visuel
+                self._save_with_content(self._get_html_text())
+            elif self._state.editor_ready:
+                self.wysiwyg_editor.get_content(self._save_with_content)
             else:
                 self._show_error("L'éditeur n'est pas encore prêt")
         else:  # HTML
             content = self.html_editor.toPlainText()
             self._save_with_content(content)
     
-    def _on_content_for_save(self, content: str) -> None:
-        """Callback pour la sauvegarde avec contenu."""
-        self._save_with_content(content)
-    
     def _save_with_content(self, content: str) -> None:
         """Sauvegarde avec le contenu spécifié."""
+        # Rien n'a changé : pas de signal, donc pas de réécriture du fichier
+        if not self._is_new_data and self._is_content_unchanged(content):
+            self._state.has_unsaved_changes = False
+            self._state.dirty_tabs.clear()
+            self._update_unsaved_indicator()
+            self._update_status("Aucune modification à sauvegarder")
+            return
+        
         try:
             # Appelle la méthode de sauvegarde spécifique
             saved_data = self._save_data(content)
             
             if saved_data:
                 # Marque comme sauvegardé
-                self._has_unsaved_changes = False
+                self._state.has_unsaved_changes = False
+                self._state.dirty_tabs.clear()
                 self._update_unsaved_indicator()
                 
                 # Émet le signal de sauvegarde
@@ -452,7 +683,11 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
                 
                 # Met à jour les données internes
                 self._data = saved_data
-                self._is_new_data = False
+                if self._is_new_data:
+                    self._is_new_data = False
+                    # Le libellé du bouton ne change qu'au passage en mode édition
+                    if self._show_action_buttons:
+                        self.save_button.setText(self._get_save_button_text())
                 
                 self._on_data_saved_success(saved_data)
                 
@@ -475,6 +710,19 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         """
         pass
     
+    def _is_content_unchanged(self, content: str) -> bool:
+        """
+        Indique si le contenu à sauvegarder est identique aux données existantes.
+        Retourne False par défaut, à surcharger si nécessaire.
+        
+        Args:
+            content: Contenu HTML à sauvegarder
+            
+        Returns:
+            True si la sauvegarde peut être ignorée
+        """
+        return False
+    
     def _on_data_saved_success(self, saved_data: Any) -> None:
         """
         Callback appelé après une sauvegarde réussie.
@@ -493,11 +741,13 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         Returns:
             Texte du bouton
         """
-        return "Mettre à jour" if not self._is_new_data else "Enregistrer"
+        return (self._SAVE_TEXT_EDIT, self._SAVE_TEXT_NEW)[self._is_new_data]
     
     def _cancel_editing(self) -> None:
         """Annule les modifications en fonction du contexte (QDialog ou non)."""
-        if self._has_unsaved_changes:
+        self._flush_pending_changes()
+        
+        if self._state.has_unsaved_changes:
             reply = QMessageBox.question(
                 self,
                 "Annuler les modifications",
@@ -510,20 +760,36 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
 
         # Cas 1 : si dans un QDialog → émettre signal pour fermeture
         top_level = self.window()
-        from PySide6.QtWidgets import QDialog
         if isinstance(top_level, QDialog):
             self.editing_cancelled.emit()
             return
 
         # Cas 2 : sinon → recharger les données
-        self._has_unsaved_changes = False
+        self._state.has_unsaved_changes = False
         self._update_unsaved_indicator()
         self._load_initial_content()
         self._update_status("Modifications annulées.")
 
+    def _show_message(self, icon: QMessageBox.Icon, title: str, message: str) -> None:
+        """
+        Affiche un message modal en réutilisant la boîte de dialogue du même niveau.
+        
+        Args:
+            icon: Niveau de gravité (icône) du message
+            title: Titre de la boîte de dialogue
+            message: Texte du message
+        """
+        box = self._message_boxes.get(icon)
+        if box is None:
+            box = QMessageBox(icon, title, "", QMessageBox.StandardButton.Ok, self)
+            self._message_boxes[icon] = box
+        box.setWindowTitle(title)
+        box.setText(message)
+        box.exec()
+    
     def _show_error(self, message: str) -> None:
         """Affiche un message d'erreur."""
-        QMessageBox.critical(self, "Erreur", message)
+        self._show_message(QMessageBox.Icon.Critical, "Erreur", message)
         self._logger.error(message)
     
     def _show_help(self) -> None:
@@ -538,32 +804,26 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         Returns:
             Texte d'aide HTML
         """
-        return """
-<h3>Aide - Éditeur</h3>
-
-<h4>Raccourcis clavier :</h4>
-<ul>
-<li><b>Ctrl+S</b> : Sauvegarder</li>
-<li><b>Ctrl+Q</b> : Annuler</li>
-<li><b>F1</b> : Afficher cette aide</li>
-</ul>
-
-<h4>Utilisation :</h4>
-<ul>
-<li><b>Éditeur Visuel</b> : Édition WYSIWYG avec formatage</li>
-<li><b>Code HTML</b> : Édition directe du code HTML</li>
-<li><b>Synchronisation</b> : Utilisez les boutons pour synchroniser entre les deux modes</li>
-</ul>
-
-<h4>Validation :</h4>
-<ul>
-<li>Le contenu HTML est validé automatiquement</li>
-<li>Les changements non sauvegardés sont indiqués</li>
-</ul>
+        return _BASE_HELP_TEXT
+    
+    def get_help_text(self) -> str:
         """
+        Retourne le texte d'aide, construit une seule fois par classe d'éditeur.
+        
+        Returns:
+            Texte d'aide HTML
+        """
+        cls = type(self)
+        help_text = _HELP_TEXT_CACHE.get(cls)
+        if help_text is None:
+            help_text = _HELP_TEXT_CACHE[cls] = self._get_help_text()
+        return help_text
     
     def _update_status(self, message: str) -> None:
         """Met à jour le message de statut."""
+        # Évite un rafraîchissement de la barre si le message est déjà affiché
+        if self.status_bar.currentMessage() == message:
+            return
         self.status_bar.showMessage(message)
     
     # Méthodes publiques pour l'interaction
@@ -584,7 +844,8 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         Returns:
             True si des modifications non sauvegardées existent
         """
-        return self._has_unsaved_changes
+        self._flush_pending_changes()
+        return self._state.has_unsaved_changes
     
     def save(self) -> bool:
         """
@@ -595,7 +856,7 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         """
         if self._validate_data():
             self._save_data_wrapper()
-            return not self._has_unsaved_changes
+            return not self._state.has_unsaved_changes
         return False
     
     def set_content_change_callback(self, callback: Callable[[str], None]) -> None:
@@ -605,7 +866,14 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         Args:
             callback: Fonction appelée lors des changements
         """
-        self._content_change_callback = callback
+        if callback is None:
+            self._content_change_callback = None
+        elif inspect.ismethod(callback):
+            # Ne retient pas l'objet propriétaire (souvent le dialogue parent)
+            self._content_change_callback = weakref.WeakMethod(callback)
+        else:
+            # Fonctions et lambdas n'ont souvent pas d'autre référence : on les garde
+            self._content_change_callback = lambda: callback
     
     def enable_auto_save(self, enabled: bool = True) -> None:
         """
@@ -614,7 +882,7 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         Args:
             enabled: True pour activer la sauvegarde automatique
         """
-        self._auto_save_enabled = enabled
+        self._state.auto_save_enabled = enabled
         if hasattr(self, 'wysiwyg_editor'):
             self.wysiwyg_editor.enable_auto_save(enabled)
     
@@ -626,7 +894,7 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
             callback: Fonction appelée avec le contenu
         """
         if self.tab_widget.currentIndex() == 0:  # WYSIWYG
-            if self._editor_ready:
+            if self._state.editor_ready:
                 self.wysiwyg_editor.get_content(callback)
             else:
                 callback("")
@@ -640,17 +908,41 @@ class BaseEditorWidget(QWidget, metaclass=MetaQWidgetABC):
         Args:
             content: Contenu HTML à charger
         """
-        if self._editor_ready:
+        if self._state.editor_ready:
             self.wysiwyg_editor.load_content(content)
-        self.html_editor.setPlainText(content)
-
-
-class MetaQDialogABC(type(QDialog), ABCMeta):
-    """Métaclasse combinée pour résoudre le conflit entre QDialog et ABC."""
-    pass
+        self._set_html_text(content)
+    
+    def reset(self, data: Optional[Any] = None) -> None:
+        """
+        Réinitialise l'éditeur avec de nouvelles données sans reconstruire ses widgets.
+        
+        Args:
+            data: Données à éditer (None pour création)
+        """
+        self._change_timer.stop()
+        self._pending_content = None
+        self._last_html_check = (None, None)
+        
+        self._data = data
+        self._is_new_data = data is None
+        if self._show_action_buttons:
+            self.save_button.setText(self._get_save_button_text())
+        
+        self._initialize_data()
+        
+        # Vide le contenu précédent puis charge le nouveau (ou au premier affichage de l'éditeur)
+        self.set_content("")
+        self._state.initial_content_loaded = False
+        if self._state.editor_ready and self._data:
+            self._load_initial_content()
+        
+        self._state.has_unsaved_changes = False
+        self._state.dirty_tabs.clear()
+        self._update_unsaved_indicator()
+        self.tab_widget.setCurrentIndex(0)
 
 
-class BaseEditorDialog(QDialog, metaclass=MetaQDialogABC):
+class BaseEditorDialog(QDialog, metaclass=_QtABCMeta):
     """
     Classe de dialogue pour les interfaces d'édition avec éditeur WYSIWYG.
     
@@ -701,6 +993,15 @@ class BaseEditorDialog(QDialog, metaclass=MetaQDialogABC):
         self.editor_widget.editing_cancelled.connect(self._on_editing_cancelled)
         self.editor_widget.help_requested.connect(self._on_help_requested)
     
+    def reset(self, data: Optional[Any] = None) -> None:
+        """
+        Réutilise le dialogue pour éditer de nouvelles données.
+        
+        Args:
+            data: Données à éditer (None pour création)
+        """
+        self.editor_widget.reset(data)
+    
     def _on_data_saved(self, data: Any) -> None:
         """Callback appelé quand les données sont sauvegardées."""
         self.data_saved.emit(data)
@@ -713,7 +1014,7 @@ class BaseEditorDialog(QDialog, metaclass=MetaQDialogABC):
     
     def _on_help_requested(self) -> None:
         """Callback appelé quand l'aide est demandée."""
-        help_text = self.editor_widget._get_help_text()
+        help_text = self.editor_widget.get_help_text()
         QMessageBox.information(self, "Aide", help_text)
     
     def closeEvent(self, event) -> None:
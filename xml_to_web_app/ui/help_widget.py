@@ -1,5 +1,5 @@
-from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
-                               QFrame, QScrollArea, QPushButton, QGridLayout)
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QLabel, 
+                               QFrame, QScrollArea)
 from PySide6.QtCore import Qt, Signal
 
 class HelpWidget(QWidget):
@@ -8,6 +8,34 @@ class HelpWidget(QWidget):
     # Signal émis lorsque l'utilisateur souhaite naviguer vers un onglet spécifique
     navigate_to_tab = Signal(int)
     
+    # Étapes du guide de démarrage rapide (numéro, titre, description)
+    _STEPS = (
+        ("1", "Présentation", "Configurez le contenu de présentation de votre édition numérique"),
+        ("2", "Projets", "Ajoutez vos projets et définissez leurs identifiants Philidor 4"),
+        ("3", "Pages légales", "Personnalisez les mentions légales et la page 'À propos'"),
+        ("4", "Import de données", "Importez votre panier de données XML depuis Philidor 4"),
+        ("5", "Génération", "Lancez la transformation XSLT et téléchargez votre site web")
+    )
+    
+    # Mise en forme d'une étape : pastille numérotée, titre et description
+    _STEP_TEMPLATE = (
+        "<table cellspacing='0' cellpadding='0'><tr>"
+        "<td width='30' height='30' align='center' valign='middle' "
+        "style='background-color: #bf957a; color: #ffffff; font-weight: bold;'>{number}</td>"
+        "<td style='padding-left: 15px;'>"
+        "<span style='color: #001632; font-size: 16px; font-weight: 600;'>{title}</span><br>"
+        "<span style='color: #4d5c70; font-size: 14px;'>{description}</span>"
+        "</td></tr></table>"
+    )
+    
+    # Conseils d'utilisation
+    _TIPS = (
+        "Suivez l'ordre des onglets de gauche à droite pour un flux optimal",
+        "Sauvegardez régulièrement vos modifications avec Ctrl+S",
+        "Vérifiez que tous vos projets sont bien configurés avant la transformation",
+        "Consultez l'onglet 'Aide' pour des informations détaillées sur chaque fonction"
+    )
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.init_ui()
@@ -30,53 +58,28 @@ class HelpWidget(QWidget):
         content_layout.setSpacing(30)
         content_layout.setContentsMargins(40, 40, 40, 40)
         
-        # Titre principal
-        title = QLabel("Aide")
-        title.setObjectName("title")
-        title.setAlignment(Qt.AlignCenter)
-        content_layout.addWidget(title)
-        
-        # Guide de démarrage rapide
-        self.create_quick_start_guide(content_layout)
-        
-        # Informations sur le flux de travail
-        self.create_workflow_info(content_layout)
-        
-        # Espacement final
-        content_layout.addStretch()
-        
-        scroll_area.setWidget(content_widget)
-        main_layout.addWidget(scroll_area)
-    
-    def create_header(self, layout):
-        """Crée l'en-tête de bienvenue"""
-        header_frame = QFrame()
-        header_frame.setObjectName("welcome-header")
-        header_layout = QVBoxLayout(header_frame)
-        header_layout.setSpacing(10)
-        header_layout.setContentsMargins(20, 30, 20, 30)
-        
-        # Titre principal
-        title_label = QLabel("Bienvenue dans XML to Web App")
-        title_label.setObjectName("main-title")
-        title_label.setAlignment(Qt.AlignCenter)
-        
-        # Sous-titre
-        subtitle_label = QLabel("Transformez vos données XML Philidor 4 en site web statique")
-        subtitle_label.setObjectName("main-subtitle")
-        subtitle_label.setAlignment(Qt.AlignCenter)
-        subtitle_label.setWordWrap(True)
-        
-        # Version ou info supplémentaire
-        version_label = QLabel("Interface intuitive • Génération automatique • Résultat professionnel")
-        version_label.setObjectName("version-info")
-        version_label.setAlignment(Qt.AlignCenter)
-        
-        header_layout.addWidget(title_label)
-        header_layout.addWidget(subtitle_label)
-        header_layout.addWidget(version_label)
-        
-        layout.addWidget(header_frame)
+        # Suspend les mises à jour : une seule passe de mise en page pour tout le contenu
+        self.setUpdatesEnabled(False)
+        try:
+            # Titre principal
+            title = QLabel("Aide")
+            title.setObjectName("title")
+            title.setAlignment(Qt.AlignCenter)
+            content_layout.addWidget(title)
+            
+            # Guide de démarrage rapide
+            self.create_quick_start_guide(content_layout)
+            
+            # Informations sur le flux de travail
+            self.create_workflow_info(content_layout)
+            
+            # Espacement final
+            content_layout.addStretch()
+            
+            scroll_area.setWidget(content_widget)
+            main_layout.addWidget(scroll_area)
+        finally:
+            self.setUpdatesEnabled(True)
     
     def create_quick_start_guide(self, layout):
         """Crée le guide de démarrage rapide"""
@@ -93,17 +96,9 @@ class HelpWidget(QWidget):
         steps_layout = QVBoxLayout()
         steps_layout.setSpacing(10)
         
-        steps = [
-            ("1", "Présentation", "Configurez le contenu de présentation de votre édition numérique"),
-            ("2", "Projets", "Ajoutez vos projets et définissez leurs identifiants Philidor 4"),
-            ("3", "Pages légales", "Personnalisez les mentions légales et la page 'À propos'"),
-            ("4", "Import de données", "Importez votre panier de données XML depuis Philidor 4"),
-            ("5", "Génération", "Lancez la transformation XSLT et téléchargez votre site web")
-        ]
-        
-        for step_num, step_title, step_desc in steps:
-            step_frame = self.create_step_item(step_num, step_title, step_desc)
-            steps_layout.addWidget(step_frame)
+        for step_num, step_title, step_desc in self._STEPS:
+            step_label = self.create_step_item(step_num, step_title, step_desc)
+            steps_layout.addWidget(step_label)
         
         guide_layout.addWidget(guide_title)
         guide_layout.addLayout(steps_layout)
@@ -111,37 +106,13 @@ class HelpWidget(QWidget):
         layout.addWidget(guide_frame)
     
     def create_step_item(self, number, title, description):
-        """Crée un élément d'étape du guide"""
-        step_frame = QFrame()
-        step_frame.setObjectName("step-item")
-        step_layout = QHBoxLayout(step_frame)
-        step_layout.setSpacing(15)
-        step_layout.setContentsMargins(15, 10, 15, 10)
-        
-        # Numéro de l'étape
-        number_label = QLabel(number)
-        number_label.setObjectName("step-number")
-        number_label.setAlignment(Qt.AlignCenter)
-        number_label.setFixedSize(30, 30)
-        
-        # Contenu de l'étape
-        content_layout = QVBoxLayout()
-        content_layout.setSpacing(5)
-        
-        title_label = QLabel(title)
-        title_label.setObjectName("step-title")
+        """Crée un élément d'étape du guide (un seul QLabel en texte riche)"""
+        step_label = QLabel(self._STEP_TEMPLATE.format(number=number, title=title, description=description))
+        step_label.setObjectName("step-item")
+        step_label.setTextFormat(Qt.RichText)
+        step_label.setWordWrap(True)
         
-        desc_label = QLabel(description)
-        desc_label.setObjectName("step-description")
-        desc_label.setWordWrap(True)
-        
-        content_layout.addWidget(title_label)
-        content_layout.addWidget(desc_label)
-        
-        step_layout.addWidget(number_label)
-        step_layout.addLayout(content_layout)
-        
-        return step_frame
+        return step_label
     
     def create_workflow_info(self, layout):
         """Crée les informations sur le flux de travail"""
@@ -154,23 +125,13 @@ class HelpWidget(QWidget):
         workflow_title = QLabel("💡 Conseils d'utilisation")
         workflow_title.setObjectName("section-title")
         
-        tips = [
-            "Suivez l'ordre des onglets de gauche à droite pour un flux optimal",
-            "Sauvegardez régulièrement vos modifications avec Ctrl+S",
-            "Vérifiez que tous vos projets sont bien configurés avant la transformation",
-            "Consultez l'onglet 'Aide' pour des informations détaillées sur chaque fonction"
-        ]
-        
-        tips_layout = QVBoxLayout()
-        tips_layout.setSpacing(8)
-        
-        for tip in tips:
-            tip_label = QLabel(f"• {tip}")
-            tip_label.setObjectName("tip-item")
-            tip_label.setWordWrap(True)
-            tips_layout.addWidget(tip_label)
+        # Liste à puces en texte riche : un seul QLabel pour tous les conseils
+        tips_label = QLabel("<ul>" + "".join(f"<li>{tip}</li>" for tip in self._TIPS) + "</ul>")
+        tips_label.setObjectName("tip-item")
+        tips_label.setTextFormat(Qt.RichText)
+        tips_label.setWordWrap(True)
         
         workflow_layout.addWidget(workflow_title)
-        workflow_layout.addLayout(tips_layout)
+        workflow_layout.addWidget(tips_label)
         
         layout.addWidget(workflow_frame)
\ No newline at end of file
@@ -5,6 +5,8 @@ Permet l'édition du contenu HTML des mentions légales avec un éditeur WYSIWYG
 Cette interface se présente sous la forme d'une classe qui hérite de BaseEditor.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import QVBoxLayout, QLabel, QGroupBox, QFormLayout
 from PySide6.QtCore import Qt
 
@@ -31,6 +33,7 @@ class LegalMentionsEditorWidget(BaseEditorWidget):
         info_layout = QFormLayout(info_group)
 
         # Informations en lecture seule (pour projets existants)
+        self.updated_label: Optional[QLabel] = None
         if not self._is_new_data:
             self.updated_label = QLabel(format_french_datetime(self._data.updated_at))
             info_layout.addRow("Modifié le:", self.updated_label)
@@ -44,7 +47,8 @@ class LegalMentionsEditorWidget(BaseEditorWidget):
             return
         
         # Met à jour les informations de lecture seule
-        self.updated_label.setText(format_french_datetime(self._data.updated_at))
+        if self.updated_label is not None:
+            self.updated_label.setText(format_french_datetime(self._data.updated_at))
         
         self._update_status(f"Chargement des mentions légales")
 
@@ -52,21 +56,23 @@ class LegalMentionsEditorWidget(BaseEditorWidget):
         """Charge le contenu initial des mentions légales."""
         if self._data and self._data.content_html:
             self.wysiwyg_editor.load_content(self._data.content_html)
-            self.html_editor.setPlainText(self._data.content_html)
-            self._initial_content_loaded = True
+            self._set_html_text(self._data.content_html)
+            self._state.initial_content_loaded = True
             self._update_status(f"Mentions légales de l'édition chargées")
         else:
             self._update_status("Mentions légales par défaut prêtes")
 
     def _validate_data(self) -> bool:
         """Valide le contenu HTML."""
-        content = self.html_editor.toPlainText()
+        content = self._get_html_text()
         try:
             validate_legal_mentions_content(content)
-            self.html_editor.setStyleSheet("")
+            if self._html_editor is not None:
+                self._set_invalid(self._html_editor, False)
             return True
         except LegalMentionsValidationError as e:
-            self.html_editor.setStyleSheet("border: 2px solid #dc3545;")
+            if self._html_editor is not None:
+                self._set_invalid(self._html_editor, True)
             self._update_status(f"Contenu HTML invalide : {e}")
             return False
 
@@ -102,7 +108,7 @@ class LegalMentionsEditorWidget(BaseEditorWidget):
     def _on_data_saved_success(self, saved_data: LegalMentions) -> None:
         """Met à jour l'interface après une sauvegarde réussie."""
         # Met à jour les informations affichées
-        if hasattr(self, 'updated_label'):
+        if self.updated_label is not None:
             self.updated_label.setText(format_french_datetime(saved_data.updated_at))
     
     def _get_help_text(self) -> str:
@@ -1,5 +1,5 @@
-from pathlib import Path
-from PySide6.QtWidgets import QMainWindow, QWidget, QLabel, QVBoxLayout, QTabWidget, QMessageBox, QScrollArea
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QMainWindow, QWidget, QVBoxLayout, QTabWidget, QMessageBox, QScrollArea
 from .welcome import WelcomeWidget
 from .projects_list import ProjectsListWidget
 from .presentation_editor_widget import PresentationEditorWidget
@@ -31,67 +31,115 @@ class MainWindow(QMainWindow):
         
         self.welcome_widget = WelcomeWidget()
 
-        self.presentation_editor = PresentationEditorWidget(self.presentation, self)
-        self.presentation_scroll_area = QScrollArea()
-        self.presentation_scroll_area.setWidgetResizable(True)
-        self.presentation_scroll_area.setWidget(self.presentation_editor)
-
-        self.project_list_widget = ProjectsListWidget(self.project_manager, self.save_projects)
-
-        self.legal_mentions_editor = LegalMentionsEditorWidget(self.legal_mentions, self)
-        self.legal_mentions_scroll_area = QScrollArea()
-        self.legal_mentions_scroll_area.setWidgetResizable(True)
-        self.legal_mentions_scroll_area.setWidget(self.legal_mentions_editor)
-
-        self.about_editor = AboutEditorWidget(self.about, self)
-        self.about_scroll_area = QScrollArea()
-        self.about_scroll_area.setWidgetResizable(True)
-        self.about_scroll_area.setWidget(self.about_editor)
-
-        self.transformation_widget = AutoTransformationWidget()
-
-        self.help_widget = HelpWidget()
-
         # Premier onglet - Sert de page d'accueil, page par défaut lorsque l'application se lance
         self.tabs.addTab(self.welcome_widget, "Accueil")
         # Deuxième onglet - Permet de modifier le contenu présentant l'édition numérique
-        self.tabs.addTab(self.presentation_scroll_area, "Présentation")
+        self.tabs.addTab(QWidget(), "Présentation")
         # Troisième onglet - Permet d'éditer les textes contextualisant les projets,
         # ainsi que le titre de chaque projet et son identifiant dans Philidor 4
-        self.tabs.addTab(self.project_list_widget, "Projets")
+        self.tabs.addTab(QWidget(), "Projets")
         # Quatrième onglet - Permet d'éditer le contenu de la page des mentions légales
-        self.tabs.addTab(self.legal_mentions_scroll_area, "Mentions légales")
+        self.tabs.addTab(QWidget(), "Mentions légales")
         # Cinquième onglet - Permet d'éditer le contenu de la page à propos
-        self.tabs.addTab(self.about_scroll_area, "A propos")
+        self.tabs.addTab(QWidget(), "A propos")
         # Sixième onglet - Permet d'importer un panier de données provenant de Philidor 4,
         # vérifie que chaque projet est bien documenté grâce à l'onglet projet,
         # effectue la transformation XSLT et retourne un site web statique sous la forme d'archive web.
-        self.tabs.addTab(self.transformation_widget, "Transformation")
+        self.tabs.addTab(QWidget(), "Transformation")
         # Septième onglet - Donne toutes les indications d'aide
-        self.tabs.addTab(self.help_widget, "Aide")
+        self.tabs.addTab(QWidget(), "Aide")
+
+        # Seul l'accueil est construit au démarrage : les autres onglets sont des
+        # emplacements vides remplacés par leur vrai contenu à la première visite
+        self._tab_factories = {
+            1: self._build_presentation_tab,
+            2: self._build_projects_tab,
+            3: self._build_legal_mentions_tab,
+            4: self._build_about_tab,
+            5: self._build_transformation_tab,
+            6: self._build_help_tab,
+        }
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
 
-        self.presentation_editor.data_saved.connect(self._on_presentation_saved)
-        self.legal_mentions_editor.data_saved.connect(self._on_legal_mentions_saved)
-        self.about_editor.data_saved.connect(self._on_about_saved)
+        self.welcome_widget.navigate_to_tab.connect(self.tabs.setCurrentIndex)
 
+    def _ensure_tab_built(self, index):
+        factory = self._tab_factories.pop(index, None)
+        if factory is None:
+            return
+
+        widget = factory()
+        title = self.tabs.tabText(index)
+
+        # Remplace l'emplacement sans réémettre currentChanged pendant l'échange
+        self.tabs.blockSignals(True)
+        try:
+            placeholder = self.tabs.widget(index)
+            self.tabs.removeTab(index)
+            self.tabs.insertTab(index, widget, title)
+            self.tabs.setCurrentIndex(index)
+        finally:
+            self.tabs.blockSignals(False)
+        placeholder.deleteLater()
+
+    def _wrap_in_scroll_area(self, widget):
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        scroll_area.setWidget(widget)
+        return scroll_area
+
+    def _build_presentation_tab(self):
+        self.presentation_editor = PresentationEditorWidget(self.presentation, self)
+        self.presentation_editor.data_saved.connect(self._on_presentation_saved)
         self.connect_help(self.presentation_editor)
+        self.presentation_scroll_area = self._wrap_in_scroll_area(self.presentation_editor)
+        return self.presentation_scroll_area
+
+    def _build_projects_tab(self):
+        self.project_list_widget = ProjectsListWidget(self.project_manager, self.save_projects)
+        return self.project_list_widget
+
+    def _build_legal_mentions_tab(self):
+        self.legal_mentions_editor = LegalMentionsEditorWidget(self.legal_mentions, self)
+        self.legal_mentions_editor.data_saved.connect(self._on_legal_mentions_saved)
         self.connect_help(self.legal_mentions_editor)
+        self.legal_mentions_scroll_area = self._wrap_in_scroll_area(self.legal_mentions_editor)
+        return self.legal_mentions_scroll_area
+
+    def _build_about_tab(self):
+        self.about_editor = AboutEditorWidget(self.about, self)
+        self.about_editor.data_saved.connect(self._on_about_saved)
         self.connect_help(self.about_editor)
+        self.about_scroll_area = self._wrap_in_scroll_area(self.about_editor)
+        return self.about_scroll_area
 
-        self.welcome_widget.navigate_to_tab.connect(self.tabs.setCurrentIndex)
+    def _build_transformation_tab(self):
+        self.transformation_widget = AutoTransformationWidget()
+        return self.transformation_widget
+
+    def _build_help_tab(self):
+        self.help_widget = HelpWidget()
+        return self.help_widget
 
-    def create_tab(self, text):
-        tab = QWidget()
-        layout = QVBoxLayout(tab)
-        layout.addWidget(QLabel(text))
-        return tab
-    
     def connect_help(self, widget):
-        widget.help_requested.connect(lambda: self._show_help_from_widget(widget))
+        widget.help_requested.connect(self._show_help_dispatch)
+
+    def _show_help_dispatch(self):
+        # Le widget émetteur est retrouvé via sender() plutôt que capturé dans une lambda
+        self._show_help_from_widget(self.sender())
 
     def _show_help_from_widget(self, widget):
-        help_text = widget._get_help_text()
-        QMessageBox.information(self, "Aide", help_text)
+        help_text = widget.get_help_text()
+        # Boîte non modale : la fenêtre principale reste utilisable pendant la lecture de l'aide.
+        # Elle est conservée par son parent et détruite à sa fermeture.
+        box = QMessageBox(self)
+        box.setIcon(QMessageBox.Icon.Information)
+        box.setWindowTitle("Aide")
+        box.setTextFormat(Qt.RichText)
+        box.setText(help_text)
+        box.setAttribute(Qt.WA_DeleteOnClose)
+        box.setModal(False)
+        box.show()
     
     def _on_presentation_saved(self, pres):
         self.presentation = pres
@@ -103,8 +151,4 @@ class MainWindow(QMainWindow):
 
     def _on_about_saved(self, pres):
         self.about = pres
-        self.save_about(pres)
-
-    def _show_help_from_widget(self, widget):
-        help_text = widget._get_help_text()
-        QMessageBox.information(self, "Aide", help_text)
\ No newline at end of file
+        self.save_about(pres)
\ No newline at end of file
@@ -6,8 +6,10 @@ ainsi que du contenu HTML de la page de présentation avec un éditeur WYSIWYG.
 Cette interface se présente sous la forme d'une classe qui hérite de BaseEditor.
 """
 
+from typing import Optional
+
 from PySide6.QtWidgets import QVBoxLayout, QLabel, QLineEdit, QGroupBox, QFormLayout
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 
 from .base_editor import BaseEditorWidget
 from ..models.presentation import Presentation, PresentationValidationError, validate_presentation_title, validate_presentation_subtitle, validate_presentation_content
@@ -32,6 +34,7 @@ class PresentationEditorWidget(BaseEditorWidget):
         info_layout = QFormLayout(info_group)
 
         # Informations en lecture seule (pour projets existants)
+        self.updated_label: Optional[QLabel] = None
         if not self._is_new_data:
             self.updated_label = QLabel(format_french_datetime(self._data.updated_at))
             info_layout.addRow("Modifié le:", self.updated_label)
@@ -53,6 +56,17 @@ class PresentationEditorWidget(BaseEditorWidget):
 
     def _setup_specific_connections(self) -> None:
         """Configure les connexions spécifiques au projet."""
+        # Validation différée de chaque champ : exécutée une fois la saisie en pause
+        self._title_timer = QTimer(self)
+        self._title_timer.setSingleShot(True)
+        self._title_timer.setInterval(200)
+        self._title_timer.timeout.connect(self._validate_presentation_title)
+
+        self._subtitle_timer = QTimer(self)
+        self._subtitle_timer.setSingleShot(True)
+        self._subtitle_timer.setInterval(200)
+        self._subtitle_timer.timeout.connect(self._validate_presentation_subtitle)
+        
         self.title_edit.textChanged.connect(self._on_title_changed)
         self.subtitle_edit.textChanged.connect(self._on_subtitle_changed)
 
@@ -66,7 +80,8 @@ class PresentationEditorWidget(BaseEditorWidget):
         self.subtitle_edit.setText(self._data.subtitle)
         
         # Met à jour les informations de lecture seule
-        self.updated_label.setText(format_french_datetime(self._data.updated_at))
+        if self.updated_label is not None:
+            self.updated_label.setText(format_french_datetime(self._data.updated_at))
         
         self._update_status(f"Chargement de la présentation")
 
@@ -74,8 +89,8 @@ class PresentationEditorWidget(BaseEditorWidget):
         """Charge le contenu initial de présentation."""
         if self._data and self._data.content_html:
             self.wysiwyg_editor.load_content(self._data.content_html)
-            self.html_editor.setPlainText(self._data.content_html)
-            self._initial_content_loaded = True
+            self._set_html_text(self._data.content_html)
+            self._state.initial_content_loaded = True
             self._update_status(f"Présentation de l'édition chargée")
         else:
             self._update_status("Présentation par défaut prête")
@@ -95,10 +110,10 @@ class PresentationEditorWidget(BaseEditorWidget):
         
         try:
             validate_presentation_title(title)
-            self.title_edit.setStyleSheet("")
+            self._set_invalid(self.title_edit, False)
             return True
         except PresentationValidationError as e:
-            self.title_edit.setStyleSheet("border: 2px solid #dc3545;")
+            self._set_invalid(self.title_edit, True)
             self._update_status(f"Titre invalide: {e}")
             return False
         
@@ -113,10 +128,10 @@ class PresentationEditorWidget(BaseEditorWidget):
         
         try:
             validate_presentation_subtitle(subtitle)
-            self.subtitle_edit.setStyleSheet("")
+            self._set_invalid(self.subtitle_edit, False)
             return True
         except PresentationValidationError as e:
-            self.subtitle_edit.setStyleSheet("border: 2px solid #dc3545;")
+            self._set_invalid(self.subtitle_edit, True)
             self._update_status(f"Sous-titre invalide: {e}")
             return False
 
@@ -156,18 +171,18 @@ class PresentationEditorWidget(BaseEditorWidget):
     def _on_data_saved_success(self, saved_data: Presentation) -> None:
         """Met à jour l'interface après une sauvegarde réussie."""
         # Met à jour les informations affichées pour les projets existants
-        if hasattr(self, 'updated_label'):
+        if self.updated_label is not None:
             self.updated_label.setText(format_french_datetime(saved_data.updated_at))
     
     def _on_title_changed(self, text: str) -> None:
         """Callback appelé quand le nom du projet change."""
         self._mark_as_changed()
-        self._validate_presentation_title()
+        self._title_timer.start()
 
     def _on_subtitle_changed(self, text: str) -> None:
         """Callback appelé quand l'identifiant du projet change."""
         self._mark_as_changed()
-        self._validate_presentation_subtitle()
+        self._subtitle_timer.start()
 
     def _get_help_text(self) -> str:
         """Retourne le texte d'aide spécifique à la présentation."""
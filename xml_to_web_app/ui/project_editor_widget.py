@@ -1,4 +1,7 @@
+from typing import Optional
+
 from PySide6.QtWidgets import QVBoxLayout, QLabel, QLineEdit, QGroupBox, QFormLayout
+from PySide6.QtCore import QTimer
 
 from .base_editor import BaseEditorWidget
 from ..models.project import Project, ProjectValidationError, validate_project_name, validate_project_id, validate_html_content
@@ -19,6 +22,8 @@ class ProjectEditorWidget(BaseEditorWidget):
         self.id_edit.setMaxLength(100)
         info_layout.addRow("Identifiant Philidor4:", self.id_edit)
 
+        self.created_label: Optional[QLabel] = None
+        self.updated_label: Optional[QLabel] = None
         if not self._is_new_data:
             self.created_label = QLabel(format_french_datetime(self._data.created_at))
             self.updated_label = QLabel(format_french_datetime(self._data.updated_at))
@@ -28,50 +33,89 @@ class ProjectEditorWidget(BaseEditorWidget):
         parent_layout.addWidget(info_group)
 
     def _setup_specific_connections(self) -> None:
+        # Dernière saisie validée par champ et son message d'erreur (None si valide)
+        self._last_name_validated = (None, None)
+        self._last_id_validated = (None, None)
+
+        # Validation différée de chaque champ : exécutée une fois la saisie en pause
+        self._name_timer = QTimer(self)
+        self._name_timer.setSingleShot(True)
+        self._name_timer.setInterval(250)
+        self._name_timer.timeout.connect(self._validate_name)
+
+        self._id_timer = QTimer(self)
+        self._id_timer.setSingleShot(True)
+        self._id_timer.setInterval(250)
+        self._id_timer.timeout.connect(self._validate_id)
+
         self.name_edit.textChanged.connect(self._on_name_changed)
         self.id_edit.textChanged.connect(self._on_id_changed)
 
     def _load_data(self) -> None:
+        self._last_name_validated = (None, None)
+        self._last_id_validated = (None, None)
         self.name_edit.setText(self._data.name)
         self.id_edit.setText(self._data.id)
 
-        if hasattr(self, 'created_label'):
+        if self.created_label is not None:
             self.created_label.setText(format_french_datetime(self._data.created_at))
             self.updated_label.setText(format_french_datetime(self._data.updated_at))
 
     def _setup_new_data(self) -> None:
+        # Vide les champs (cas d'un éditeur réutilisé) sans les signaler invalides
+        self.name_edit.clear()
+        self.id_edit.clear()
+        self._name_timer.stop()
+        self._id_timer.stop()
+        self._set_invalid(self.name_edit, False)
+        self._set_invalid(self.id_edit, False)
+        self._last_name_validated = (None, None)
+        self._last_id_validated = (None, None)
+
         self.name_edit.setPlaceholderText("Nom du nouveau projet")
         self.name_edit.setFocus()
 
     def _load_initial_content(self) -> None:
         if self._data and self._data.description_html:
             self.set_content(self._data.description_html)
-            self._initial_content_loaded = True
+            self._state.initial_content_loaded = True
 
     def _validate_data(self) -> bool:
         return self._validate_name() and self._validate_id()
 
     def _validate_name(self) -> bool:
         name = self.name_edit.text().strip()
-        try:
-            validate_project_name(name)
-            self.name_edit.setStyleSheet("")
-            return True
-        except ProjectValidationError as e:
-            self.name_edit.setStyleSheet("border: 2px solid #dc3545;")
-            self._update_status(f"Nom invalide: {e}")
+        last_name, error = self._last_name_validated
+        if last_name != name:
+            # Saisie modifiée : nouvelle validation et mise à jour du style du champ
+            try:
+                validate_project_name(name)
+                error = None
+            except ProjectValidationError as e:
+                error = str(e)
+            self._set_invalid(self.name_edit, error is not None)
+            self._last_name_validated = (name, error)
+        if error is not None:
+            self._update_status(f"Nom invalide: {error}")
             return False
+        return True
 
     def _validate_id(self) -> bool:
         project_id = self.id_edit.text().strip()
-        try:
-            validate_project_id(project_id)
-            self.id_edit.setStyleSheet("")
-            return True
-        except ProjectValidationError as e:
-            self.id_edit.setStyleSheet("border: 2px solid #dc3545;")
-            self._update_status(f"Identifiant invalide: {e}")
+        last_id, error = self._last_id_validated
+        if last_id != project_id:
+            # Saisie modifiée : nouvelle validation et mise à jour du style du champ
+            try:
+                validate_project_id(project_id)
+                error = None
+            except ProjectValidationError as e:
+                error = str(e)
+            self._set_invalid(self.id_edit, error is not None)
+            self._last_id_validated = (project_id, error)
+        if error is not None:
+            self._update_status(f"Identifiant invalide: {error}")
             return False
+        return True
 
     def _save_data(self, content: str) -> Project:
         name = self.name_edit.text().strip()
@@ -88,16 +132,16 @@ class ProjectEditorWidget(BaseEditorWidget):
             return self._data
 
     def _on_data_saved_success(self, saved_data: Project) -> None:
-        if hasattr(self, 'updated_label'):
+        if self.updated_label is not None:
             self.updated_label.setText(format_french_datetime(saved_data.updated_at))
 
     def _on_name_changed(self, text: str) -> None:
         self._mark_as_changed()
-        self._validate_name()
+        self._name_timer.start()
 
     def _on_id_changed(self, text: str) -> None:
         self._mark_as_changed()
-        self._validate_id()
+        self._id_timer.start()
 
     def _get_help_text(self) -> str:
         base_help = super()._get_help_text()
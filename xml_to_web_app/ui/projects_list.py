@@ -1,11 +1,73 @@
 from PySide6.QtWidgets import (
-    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QCheckBox,
-    QPushButton, QTextEdit, QMessageBox, QGroupBox, QFormLayout
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QListView, QCheckBox,
+    QPushButton, QMessageBox, QGroupBox, QFormLayout, QScrollArea
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex, QSignalBlocker, QTimer
 from .project_editor_dialog import ProjectEditorDialog
 from ..utils.french_date_utils import format_french_datetime
 
+class ProjectListModel(QAbstractListModel):
+    """Modèle de la liste des projets : une ligne (uuid, nom) par projet."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = []
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        project_uuid, name = self._rows[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == Qt.UserRole:
+            return project_uuid
+        return None
+
+    def set_projects(self, projects):
+        """Remplace le contenu du modèle par les projets donnés, en une seule réinitialisation."""
+        self.beginResetModel()
+        self._rows = [(project.uuid, project.name) for project in projects]
+        self.endResetModel()
+
+    def add_project(self, project):
+        """Insère un nouveau projet en tête de liste (le plus récemment modifié)."""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self._rows.insert(0, (project.uuid, project.name))
+        self.endInsertRows()
+
+    def update_project(self, project):
+        """Met à jour la ligne d'un projet modifié et la remonte en tête de liste."""
+        row = self._row_of(project.uuid)
+        if row is None:
+            self.add_project(project)
+            return
+        if row > 0:
+            self.beginMoveRows(QModelIndex(), row, row, QModelIndex(), 0)
+            self._rows.insert(0, self._rows.pop(row))
+            self.endMoveRows()
+        self._rows[0] = (project.uuid, project.name)
+        top = self.index(0)
+        self.dataChanged.emit(top, top, [Qt.DisplayRole])
+
+    def remove_project(self, project_uuid):
+        """Retire la ligne du projet donné, s'il est présent."""
+        row = self._row_of(project_uuid)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self.endRemoveRows()
+
+    def _row_of(self, project_uuid):
+        """Retourne la ligne du projet donné, ou None s'il est absent."""
+        for row, (row_uuid, _) in enumerate(self._rows):
+            if row_uuid == project_uuid:
+                return row
+        return None
+
 class ProjectsListWidget(QWidget):
     def __init__(self, project_manager, save_callback):
         super().__init__()
@@ -26,10 +88,20 @@ class ProjectsListWidget(QWidget):
         # et la prévisualisation des informations du projet à droite
         self.main_layout = QHBoxLayout()
 
-        # Widget de gauche
-        self.list_widget = QListWidget()
+        # Widget de gauche : la vue ne dessine que les lignes visibles du modèle
+        self.list_widget = QListView()
+        # Lignes de hauteur identique : la vue n'a pas à mesurer chaque ligne pour défiler
+        self.list_widget.setUniformItemSizes(True)
+        self.project_model = ProjectListModel(self)
+        self.list_widget.setModel(self.project_model)
+
+        # Aperçu différé : une navigation rapide dans la liste ne met à jour l'aperçu qu'une fois
+        self._preview_timer = QTimer(self)
+        self._preview_timer.setSingleShot(True)
+        self._preview_timer.setInterval(50)
+        self._preview_timer.timeout.connect(self.update_preview)
 
-        self.list_widget.itemSelectionChanged.connect(self.update_preview)
+        self.list_widget.selectionModel().selectionChanged.connect(self._schedule_preview)
 
         # widget de droite 
         self.prewiew_widget = QGroupBox()
@@ -58,12 +130,23 @@ class ProjectsListWidget(QWidget):
         self.html_preview_title = QLabel("Description du projet")
         self.html_preview_title.setObjectName("sub-group")
 
-        self.html_preview = QTextEdit()
-        self.html_preview.setObjectName("no-hover")
-        self.html_preview.setReadOnly(True)
+        # Aperçu en lecture seule : un QLabel en texte riche suffit, sans document éditable
+        self.html_preview = QLabel()
+        self.html_preview.setObjectName("html-preview")
+        self.html_preview.setTextFormat(Qt.RichText)
+        self.html_preview.setWordWrap(True)
+        self.html_preview.setOpenExternalLinks(True)
+        self.html_preview.setAlignment(Qt.AlignTop | Qt.AlignLeft)
+
+        self.html_preview_area = QScrollArea()
+        self.html_preview_area.setObjectName("html-preview")
+        self.html_preview_area.setWidgetResizable(True)
+        self.html_preview_area.setWidget(self.html_preview)
+        # HTML actuellement affiché dans l'aperçu (None si vide)
+        self._current_preview_html = None
 
         self.preview_layout.addWidget(self.html_preview_title)
-        self.preview_layout.addWidget(self.html_preview)
+        self.preview_layout.addWidget(self.html_preview_area)
 
         self.prewiew_widget.setLayout(self.preview_layout)
 
@@ -74,6 +157,9 @@ class ProjectsListWidget(QWidget):
 
         global_layout.addWidget(self.main_widget)
 
+        # Dialogues d'édition réutilisés (clé : True pour la création, False pour la modification)
+        self._editor_dialogs = {}
+
         # Ajout des boutons pour créer et modifier des projets
         self.edit_button = QPushButton("Modifier le projet")
         self.edit_button.clicked.connect(self.edit_selected_project)
@@ -95,22 +181,23 @@ class ProjectsListWidget(QWidget):
 
     def refresh_project_list(self):
         """Met à jour la liste des projets enregistrés"""
-        self.list_widget.clear()
-        for project in self.project_manager.list_projects():
-            item = QListWidgetItem(project.name)
-            item.setFlags(item.flags() & ~Qt.ItemIsUserCheckable)
-            item.setData(Qt.UserRole, project.uuid)
-            self.list_widget.addItem(item)
-            self.edit_button.setEnabled(False)
-            self.delete_button.setEnabled(False)
+        # Aucune mise à jour de l'aperçu pendant le remplacement des lignes
+        with QSignalBlocker(self.list_widget.selectionModel()):
+            self.project_model.set_projects(self.project_manager.list_projects())
+
+        # La sélection a été vidée par la réinitialisation : l'aperçu et les boutons
+        # sont remis à blanc
+        self.update_preview()
 
-        self.list_widget.itemChanged.connect(self.update_preview)
+    def _schedule_preview(self):
+        # Relance le délai à chaque changement de sélection
+        self._preview_timer.start()
 
     def update_preview(self):
         """Met à jour la prévisualisation selon l'élément sélectionné."""
-        selected_items = self.list_widget.selectedItems()
-        if not selected_items:
-            self.html_preview.clear()
+        project_uuid = self._selected_project_uuid()
+        if project_uuid is None:
+            self._set_preview_html(None)
             self.id_label.setText("")
             self.created_label.setText("")
             self.updated_label.setText("")
@@ -118,43 +205,50 @@ class ProjectsListWidget(QWidget):
             self.delete_button.setEnabled(False)
             return
 
-        item = selected_items[0]
-        project_uuid = item.data(Qt.UserRole)
         project = self.project_manager.get_project(project_uuid)
-        self.html_preview.setHtml(project.description_html or "<i>Aucune description</i>")
+        self._set_preview_html(project.description_html or "<i>Aucune description</i>")
         self.id_label.setText(str(project.id))
         self.created_label.setText(format_french_datetime(project.created_at))
         self.updated_label.setText(format_french_datetime(project.updated_at))
         self.edit_button.setEnabled(True)
         self.delete_button.setEnabled(True)
 
+    def _selected_project_uuid(self):
+        """Retourne l'uuid du projet sélectionné, ou None si aucune ligne ne l'est."""
+        indexes = self.list_widget.selectionModel().selectedIndexes()
+        if not indexes:
+            return None
+        return indexes[0].data(Qt.UserRole)
+
+    def _set_preview_html(self, html):
+        """Affiche le HTML dans l'aperçu, sans reparser un contenu déjà affiché (None vide l'aperçu)."""
+        if html == self._current_preview_html:
+            return
+        self.html_preview.setText("" if html is None else html)
+        self._current_preview_html = html
 
     def edit_selected_project(self):
         """Edite le projet sélectionné"""
-        selected_items = self.list_widget.selectedItems()
+        project_uuid = self._selected_project_uuid()
 
-        if not selected_items:
+        if project_uuid is None:
             QMessageBox.information(self, "Aucun projet sélectionné", "Cochez un projet pour le modifier.")
             return
 
-        project_uuid = selected_items[0].data(Qt.UserRole)
         project = self.project_manager.get_project(project_uuid)
 
-        editor = ProjectEditorDialog(project, self)
-        editor.data_saved.connect(lambda p: self._finalize_project_edit(editor, p))
-        editor.exec()
+        self._get_editor_dialog(project).exec()
 
     def delete_selected_project(self):
         """Supprime le projet sélectionné après confirmation"""
         # Trouver le projet coché
-        selected_items = self.list_widget.selectedItems()
+        project_uuid = self._selected_project_uuid()
         
-        if not selected_items:
+        if project_uuid is None:
             QMessageBox.information(self, "Aucun projet sélectionné", 
                                 "Cochez un projet pour le supprimer.")
             return
 
-        project_uuid = selected_items[0].data(Qt.UserRole)
         project = self.project_manager.get_project(project_uuid)
         
         # Dialog de confirmation
@@ -174,8 +268,8 @@ class ProjectsListWidget(QWidget):
                 success = self.project_manager.delete_project(project_uuid)
                 if success:
                     self.save_callback()  # Sauvegarder les changements
-                    self.refresh_project_list()  # Rafraîchir la liste
-                    self.html_preview.clear()  # Vider la prévisualisation
+                    self.project_model.remove_project(project_uuid)  # Retirer la ligne
+                    self.update_preview()  # Vider la prévisualisation
                     QMessageBox.information(self, "Suppression réussie", 
                                         f"Le projet '{project.name}' a été supprimé.")
                 else:
@@ -186,32 +280,47 @@ class ProjectsListWidget(QWidget):
 
     def create_new_project(self):
         """Crée un nouveau projet"""
-        editor = ProjectEditorDialog(parent=self)
-        editor.data_saved.connect(lambda p: self._finalize_project_edit(editor, p))
-        editor.exec()
+        self._get_editor_dialog(None).exec()
+
+    def _get_editor_dialog(self, project):
+        """
+        Retourne le dialogue d'édition, construit une seule fois puis réinitialisé
+        avec le projet demandé. Un dialogue est gardé pour la création et un pour la
+        modification, leurs formulaires n'ayant pas les mêmes champs.
+        """
+        is_new = project is None
+        editor = self._editor_dialogs.get(is_new)
+        if editor is None:
+            editor = ProjectEditorDialog(project, self)
+            editor.data_saved.connect(lambda p: self._finalize_project_edit(editor, p))
+            self._editor_dialogs[is_new] = editor
+        else:
+            editor.reset(project)
+        return editor
 
     def _finalize_project_edit(self, editor, project):
         try:
             if self.project_manager.get_project_by_uuid(project.uuid):
                 # Projet existant → mise à jour
-                self.project_manager.update_project(
+                project = self.project_manager.update_project(
                     project.uuid,
                     project.name,
                     project.id,
                     project.description_html
                 )
+                self.project_model.update_project(project)
             else:
                 # Nouveau projet → création
-                self.project_manager.create_project(
+                project = self.project_manager.create_project(
                     name=project.name,
                     description_html=project.description_html,
                     project_id=project.id,
                     project_uuid=project.uuid
                 )
+                self.project_model.add_project(project)
 
             self.save_callback()
-            self.refresh_project_list()
-            self.html_preview.clear()
+            self.update_preview()
             editor.accept()
 
         except Exception as e:
@@ -1,24 +1,71 @@
 import os
+import logging
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Dict, Any, List, Set
 
 from PySide6.QtWidgets import (QWidget, QGroupBox, QVBoxLayout, QHBoxLayout, 
                                QLabel, QFileDialog, QPushButton, QTextEdit, 
-                               QMessageBox, QProgressBar, QListWidget, QSplitter)
-from PySide6.QtCore import QThread, Qt, Signal
-from PySide6.QtGui import QFont
+                               QMessageBox, QProgressBar, QListWidget, QSplitter,
+                               QApplication)
+from PySide6.QtCore import QThread, Qt, Signal, QUrl
+from PySide6.QtGui import QFont, QDesktopServices
 
 from ..core.xml_processor import XMLProcessor
 from ..core.transformer_engine import TransformationWorker, XSLTTransformationEngine
 
+_logger = logging.getLogger(__name__)
 
-class AutoTransformationWidget(QWidget):
+# Répertoire des ressources de l'application (données et fichiers temporaires)
+_RESOURCES_DIR = str(Path(__file__).resolve().parent.parent / "resources")
+
+
+class _XMLWorkerMixin:
+    """
+    Cycle de vie du worker XML partagé par les widgets de fusion.
+    
+    La classe hôte déclare le signal `xml_processing_requested` et les slots
+    `update_progress`, `on_merge_completed` et `on_error`.
+    """
+    
+    def _ensure_xml_worker(self):
+        """Crée au premier traitement le worker XML et son thread, réutilisés ensuite"""
+        if self.xml_thread is not None:
+            return
+        
+        self.xml_thread = QThread(self)
+        self.xml_processor = XMLProcessor(None, _RESOURCES_DIR)
+        self.xml_processor.moveToThread(self.xml_thread)
+        
+        # Connexions établies une seule fois pour tous les traitements ; la demande
+        # de fusion est mise en file pour s'exécuter dans le thread du worker
+        self.xml_processing_requested.connect(self.xml_processor.process_file, Qt.QueuedConnection)
+        self.xml_processor.progress_updated.connect(self.update_progress)
+        self.xml_processor.merge_completed.connect(self.on_merge_completed)
+        self.xml_processor.error_occurred.connect(self.on_error)
+        QApplication.instance().aboutToQuit.connect(self._stop_xml_thread)
+        
+        # Le worker est détruit dans son thread une fois la boucle d'événements arrêtée
+        self.xml_thread.finished.connect(self.xml_processor.deleteLater)
+        
+        self.xml_thread.start()
+    
+    def _stop_xml_thread(self):
+        """Arrête le thread du worker XML s'il tourne"""
+        if self.xml_thread is not None and self.xml_thread.isRunning():
+            self.xml_thread.quit()
+            self.xml_thread.wait()
+
+
+class AutoTransformationWidget(_XMLWorkerMixin, QWidget):
     """Widget principal pour le workflow automatisé fusion + transformation"""
     
     # Signal pour demander l'ouverture de l'onglet Projets
     request_projects_tab = Signal(list)  # Liste des projets manquants
     
+    # Demande de fusion transmise au worker XML (chemin du fichier source)
+    xml_processing_requested = Signal(str)
+    
     def __init__(self):
         super().__init__()
         self.xml_processor = None
@@ -163,26 +210,9 @@ class AutoTransformationWidget(QWidget):
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         
-        # Détermine les répertoires
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parent.parent
-        resources_dir = project_root / "resources"
-        
-        # Démarre la fusion XML
-        self.xml_thread = QThread()
-        self.xml_processor = XMLProcessor(self.selected_file_path, str(resources_dir))
-        self.xml_processor.moveToThread(self.xml_thread)
-        
-        # Connexions des signaux pour la fusion
-        self.xml_thread.started.connect(self.xml_processor.process)
-        self.xml_processor.progress_updated.connect(self.update_progress)
-        self.xml_processor.merge_completed.connect(self.on_merge_completed)
-        self.xml_processor.error_occurred.connect(self.on_error)
-        self.xml_processor.merge_completed.connect(self.xml_thread.quit)
-        self.xml_processor.error_occurred.connect(self.xml_thread.quit)
-        self.xml_thread.finished.connect(self.xml_thread.deleteLater)
-        
-        self.xml_thread.start()
+        # Démarre la fusion XML dans le thread du worker
+        self._ensure_xml_worker()
+        self.xml_processing_requested.emit(self.selected_file_path)
     
     def update_progress(self, value):
         """Met à jour la barre de progression"""
@@ -317,9 +347,9 @@ class AutoTransformationWidget(QWidget):
             try:
                 if self.merged_file_path and Path(self.merged_file_path).exists():
                     os.remove(self.merged_file_path)
-                    print(f"Fichier fusionné supprimé : {self.merged_file_path}")
+                    _logger.debug(f"Fichier fusionné supprimé : {self.merged_file_path}")
             except Exception as e:
-                print(f"Erreur lors de la suppression du fichier fusionné : {e}")
+                _logger.warning(f"Erreur lors de la suppression du fichier fusionné : {e}")
             
             # Affiche les résultats
             info_text = f"""✓ Transformation terminée avec succès !
@@ -415,14 +445,18 @@ Le fichier ZIP est prêt à être téléchargé."""
             self.transformation_worker.terminate()
             self.transformation_worker.wait()
         
+        self._stop_xml_thread()
         self.transformation_engine.cleanup()
         event.accept()
 
 
 # Widget de fusion simple (pour usage séparé si nécessaire)
-class SimpleFusionWidget(QWidget):
+class SimpleFusionWidget(_XMLWorkerMixin, QWidget):
     """Widget simplifié pour la fusion XML uniquement"""
     
+    # Demande de fusion transmise au worker XML (chemin du fichier source)
+    xml_processing_requested = Signal(str)
+    
     def __init__(self):
         super().__init__()
         self.xml_processor = None
@@ -500,27 +534,12 @@ class SimpleFusionWidget(QWidget):
             QMessageBox.warning(self, "Erreur", "Aucun fichier sélectionné")
             return
         
-        current_file = Path(__file__).resolve()
-        project_root = current_file.parent.parent
-        resources_dir = project_root / "resources"
-        
-        self.xml_thread = QThread()
-        self.xml_processor = XMLProcessor(self.selected_file_path, str(resources_dir))
-        self.xml_processor.moveToThread(self.xml_thread)
-        
-        # Connexions des signaux
-        self.xml_thread.started.connect(self.xml_processor.process)
-        self.xml_processor.progress_updated.connect(self.update_progress)
-        self.xml_processor.merge_completed.connect(self.on_merge_completed)
-        self.xml_processor.error_occurred.connect(self.on_error)
-        self.xml_processor.merge_completed.connect(self.xml_thread.quit)
-        self.xml_processor.error_occurred.connect(self.xml_thread.quit)
-        self.xml_thread.finished.connect(self.xml_thread.deleteLater)
-        
         self.progress_bar.setVisible(True)
         self.progress_bar.setValue(0)
         self.process_button.setEnabled(False)
-        self.xml_thread.start()
+        
+        self._ensure_xml_worker()
+        self.xml_processing_requested.emit(self.selected_file_path)
     
     def update_progress(self, value):
         """Met à jour la barre de progression"""
@@ -558,21 +577,12 @@ class SimpleFusionWidget(QWidget):
         if self.merged_file_path:
             temp_dir = Path(self.merged_file_path).parent
             
-            import subprocess
-            import platform
-            
-            try:
-                if platform.system() == "Windows":
-                    subprocess.run(["explorer", str(temp_dir)])
-                elif platform.system() == "Darwin":
-                    subprocess.run(["open", str(temp_dir)])
-                else:
-                    subprocess.run(["xdg-open", str(temp_dir)])
-            except Exception as e:
+            # Ouverture par le gestionnaire de fichiers du système, sans processus externe
+            if not QDesktopServices.openUrl(QUrl.fromLocalFile(str(temp_dir))):
                 QMessageBox.warning(
                     self, 
                     "Erreur", 
-                    f"Impossible d'ouvrir le répertoire :\n{str(e)}\n\n"
+                    "Impossible d'ouvrir le répertoire.\n\n"
                     f"Chemin : {temp_dir}"
                 )
     
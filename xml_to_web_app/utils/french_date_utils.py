@@ -3,9 +3,78 @@ Utilitaires pour le formatage des dates et heures à la française
 """
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Union, Optional
 import locale
 
+# Noms des mois et des jours en français
+MOIS_FRANCAIS = (
+    "", "janvier", "février", "mars", "avril", "mai", "juin",
+    "juillet", "août", "septembre", "octobre", "novembre", "décembre"
+)
+
+JOURS_FRANCAIS = (
+    "lundi", "mardi", "mercredi", "jeudi",
+    "vendredi", "samedi", "dimanche"
+)
+
+
+@lru_cache(maxsize=1024)
+def _format_absolute_datetime(dt: datetime, include_time: bool, include_seconds: bool) -> str:
+    """
+    Formate une date/heure au format absolu (« 11 juin 2025 à 14:30 »).
+    
+    Le résultat ne dépend que des arguments et est donc mis en cache :
+    les rafraîchissements successifs d'une même date ne refont pas le formatage.
+    La taille du cache couvre les dates de création et de modification d'une
+    longue liste de projets parcourue dans l'aperçu.
+    """
+    date_str = f"{dt.day} {MOIS_FRANCAIS[dt.month]} {dt.year}"
+    
+    # Ajout de l'heure si demandé
+    if include_time:
+        if include_seconds:
+            heure_str = dt.strftime("%H:%M:%S")
+        else:
+            heure_str = dt.strftime("%H:%M")
+        date_str += f" à {heure_str}"
+    
+    return date_str
+
+
+@lru_cache(maxsize=256)
+def _parse_datetime_string(value: str) -> Optional[datetime]:
+    """
+    Convertit une chaîne de date en datetime (résultat mis en cache).
+    
+    Args:
+        value: Date sous forme de chaîne
+        
+    Returns:
+        datetime correspondant, ou None si la chaîne n'est pas une date valide
+    """
+    # Essaie plusieurs formats courants
+    formats = (
+        "%Y-%m-%d %H:%M:%S.%f",  # Format avec microsecondes
+        "%Y-%m-%d %H:%M:%S",     # Format standard
+        "%Y-%m-%dT%H:%M:%S.%f",  # Format ISO avec microsecondes
+        "%Y-%m-%dT%H:%M:%S",     # Format ISO
+        "%Y-%m-%d",              # Date seule
+    )
+    
+    for fmt in formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    
+    # Si aucun format ne fonctionne, essaie le parsing automatique
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, TypeError):
+        return None
+
+
 def format_french_datetime(
     dt: Union[datetime, str], 
     include_time: bool = True,
@@ -37,52 +106,15 @@ def format_french_datetime(
     
     # Conversion string vers datetime si nécessaire
     if isinstance(dt, str):
-        try:
-            # Essaie plusieurs formats courants
-            formats = [
-                "%Y-%m-%d %H:%M:%S.%f",  # Format avec microsecondes
-                "%Y-%m-%d %H:%M:%S",     # Format standard
-                "%Y-%m-%dT%H:%M:%S.%f",  # Format ISO avec microsecondes
-                "%Y-%m-%dT%H:%M:%S",     # Format ISO
-                "%Y-%m-%d",              # Date seule
-            ]
-            
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(dt, fmt)
-                    break
-                except ValueError:
-                    continue
-            else:
-                # Si aucun format ne fonctionne, essaie le parsing automatique
-                dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
-                
-        except (ValueError, TypeError) as e:
+        parsed = _parse_datetime_string(dt)
+        if parsed is None:
             return f"Date invalide: {dt}"
+        dt = parsed
     
     if not isinstance(dt, datetime):
         return "Format de date non supporté"
     
-    # Noms des mois en français
-    mois_francais = [
-        "", "janvier", "février", "mars", "avril", "mai", "juin",
-        "juillet", "août", "septembre", "octobre", "novembre", "décembre"
-    ]
-    
-    # Format de base : jour mois année
-    jour = dt.day
-    mois = mois_francais[dt.month]
-    annee = dt.year
-    
-    date_str = f"{jour} {mois} {annee}"
-    
-    # Ajout de l'heure si demandé
-    if include_time:
-        if include_seconds:
-            heure_str = dt.strftime("%H:%M:%S")
-        else:
-            heure_str = dt.strftime("%H:%M")
-        date_str += f" à {heure_str}"
+    date_str = _format_absolute_datetime(dt, include_time, include_seconds)
     
     # Format relatif si demandé et récent
     if relative:
@@ -109,11 +141,7 @@ def format_french_datetime(
                 return "Hier"
         elif diff.days < 7:
             # Cette semaine
-            jours_francais = [
-                "lundi", "mardi", "mercredi", "jeudi", 
-                "vendredi", "samedi", "dimanche"
-            ]
-            jour_semaine = jours_francais[dt.weekday()]
+            jour_semaine = JOURS_FRANCAIS[dt.weekday()]
             if include_time:
                 if include_seconds:
                     return f"{jour_semaine.capitalize()} à {dt.strftime('%H:%M:%S')}"
@@ -5,6 +5,8 @@ Fonctions communes pour la validation, parsing et transformation XML.
 
 import xml.etree.ElementTree as ET
 from pathlib import Path
+import copy
+from functools import lru_cache
 from typing import List, Dict, Optional, Union, Tuple
 import re
 from datetime import datetime
@@ -144,12 +146,9 @@ def find_project_references(root: ET.Element,
         Liste unique des références de projets trouvées
     """
     if patterns is None:
-        patterns = [
-            r'project[_-](\w+)',           # project_xxx ou project-xxx
-            r'proj[_-](\w+)',              # proj_xxx ou proj-xxx
-            r'(\w+)[_-]project',           # xxx_project ou xxx-project
-            r'project["\']?\s*[:=]\s*["\']?(\w+)',  # project: xxx ou project="xxx"
-        ]
+        regexes = _PROJECT_REGEXES
+    else:
+        regexes = [re.compile(pattern, re.IGNORECASE) for pattern in patterns]
     
     references = set()
     
@@ -161,16 +160,14 @@ def find_project_references(root: ET.Element,
                 references.add(attr_value)
             
             # Applique les patterns sur les valeurs d'attributs
-            for pattern in patterns:
-                matches = re.findall(pattern, attr_value, re.IGNORECASE)
-                references.update(matches)
+            for regex in regexes:
+                references.update(regex.findall(attr_value))
         
         # Cherche dans le texte
         text_content = extract_text_content(elem, include_children=False)
         if text_content:
-            for pattern in patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
-                references.update(matches)
+            for regex in regexes:
+                references.update(regex.findall(text_content))
     
     return sorted(list(references))
 
@@ -183,26 +180,11 @@ def prettify_xml(element: ET.Element, indent: str = "  ") -> None:
         element: Élément XML à formater
         indent: Chaîne d'indentation à utiliser
     """
-    def _indent(elem, level=0):
-        i = "\n" + level * indent
-        if len(elem):
-            if not elem.text or not elem.text.strip():
-                elem.text = i + indent
-            if not elem.tail or not elem.tail.strip():
-                elem.tail = i
-            for child in elem:
-                _indent(child, level + 1)
-            if not child.tail or not child.tail.strip():
-                child.tail = i
-        else:
-            if level and (not elem.tail or not elem.tail.strip()):
-                elem.tail = i
-    
-    _indent(element)
+    ET.indent(element, space=indent)
 
 
 def xml_to_string(element: ET.Element, pretty: bool = True, 
-                  encoding: str = 'unicode') -> str:
+                  encoding: str = 'unicode', in_place: bool = False) -> str:
     """
     Convertit un élément XML en chaîne de caractères.
     
@@ -210,14 +192,15 @@ def xml_to_string(element: ET.Element, pretty: bool = True,
         element: Élément XML à convertir
         pretty: Si True, formate le XML avec indentation
         encoding: Encodage à utiliser ('unicode' pour str, sinon bytes)
+        in_place: Si True, indente directement l'élément au lieu d'une copie
+            (pour les éléments construits uniquement pour la sérialisation)
         
     Returns:
         Chaîne XML
     """
     if pretty:
-        # Crée une copie pour ne pas modifier l'original
-        import copy
-        elem_copy = copy.deepcopy(element)
+        # Crée une copie pour ne pas modifier l'original, sauf si demandé
+        elem_copy = element if in_place else copy.deepcopy(element)
         prettify_xml(elem_copy)
         return ET.tostring(elem_copy, encoding=encoding, method='xml')
     else:
@@ -428,6 +411,9 @@ PROJECT_PATTERNS = [
     r'project["\']?\s*[:=]\s*["\']?(\w+)',
 ]
 
+# Versions compilées, utilisées par défaut par find_project_references
+_PROJECT_REGEXES = [re.compile(pattern, re.IGNORECASE) for pattern in PROJECT_PATTERNS]
+
 # === Fonctions spécifiques pour la validation ===
 
 class ValidationError(Exception):
@@ -461,6 +447,34 @@ def validate_html_content(content: str, max_length: int = 50000) -> None:
         raise ValidationError(f"Structure HTML invalide: {e}")
 
 
+@lru_cache(maxsize=64)
+def check_html_content(content: str, max_length: int = 50000) -> Optional[str]:
+    """
+    Valide le contenu HTML en mémorisant le verdict pour un contenu donné.
+    
+    Args:
+        content: Contenu HTML à valider
+        max_length: Taille maximale autorisée
+        
+    Returns:
+        None si le contenu est valide, sinon le message d'erreur
+    """
+    try:
+        validate_html_content(content, max_length=max_length)
+        return None
+    except ValidationError as e:
+        return str(e)
+
+
+# Balises HTML et balises auto-fermantes pour la validation de structure
+_HTML_TAG_RE = re.compile(r'<(/?)(\w+)(?:\s[^>]*)?\s*(/?)>')
+
+_SELF_CLOSING_TAGS = frozenset({
+    'br', 'hr', 'img', 'input', 'meta', 'link', 'area', 'base', 
+    'col', 'embed', 'source', 'track', 'wbr'
+})
+
+
 def _validate_html_structure(content: str) -> None:
     """
     Validation basique de la structure HTML.
@@ -474,19 +488,11 @@ def _validate_html_structure(content: str) -> None:
     # Stack pour vérifier l'imbrication des balises
     stack = []
     
-    # Balises auto-fermantes
-    self_closing_tags = {
-        'br', 'hr', 'img', 'input', 'meta', 'link', 'area', 'base', 
-        'col', 'embed', 'source', 'track', 'wbr'
-    }
-    
     # Trouve toutes les balises
-    tag_pattern = re.compile(r'<(/?)(\w+)(?:\s[^>]*)?\s*(/?)>')
-    
-    for match in tag_pattern.finditer(content):
+    for match in _HTML_TAG_RE.finditer(content):
         is_closing = match.group(1) == '/'
         tag_name = match.group(2).lower()
-        is_self_closing = match.group(3) == '/' or tag_name in self_closing_tags
+        is_self_closing = match.group(3) == '/' or tag_name in _SELF_CLOSING_TAGS
         
         if is_closing:
             # Balise fermante